@@ -10,6 +10,9 @@ class GameEngine:
         self.running = True
         self.current_game = None
         self.game_state = "MENU"
+        self.clear_color = (25, 25, 40)  # Professional dark blue
+        self._full_redraw = True  # Next frame must present the whole screen
+        self._last_overlay_rects = []
         self.config = self._load_config()
         
         # Initialize systems
@@ -72,8 +75,10 @@ class GameEngine:
                 self.running = False
         elif event.key == pygame.K_F1:
             self.config['show_fps'] = not self.config['show_fps']
+            self._full_redraw = True
         elif event.key == pygame.K_F3:
             self.config['debug_mode'] = not self.config['debug_mode']
+            self._full_redraw = True
             
     def _update(self, delta_time: float):
         """Update game logic"""
@@ -85,25 +90,39 @@ class GameEngine:
     def _render(self):
         """Render current frame"""
         # Clear screen with professional dark blue
-        self.screen.fill((25, 25, 40))
+        self.screen.fill(self.clear_color)
         
-        # Render current state
+        # Render current state; games may report the screen regions they changed
+        dirty_rects = None
         if self.game_state == "MENU":
             self.menu_manager.render(self.screen)
         elif self.game_state == "GAMEPLAY" and self.current_game:
-            self.current_game.render(self.screen)
+            dirty_rects = self.current_game.render(self.screen)
             
         # Render debug information
         if self.config['show_fps']:
-            self._render_debug_info()
-            
-        pygame.display.flip()
+            overlay_rects = self._render_debug_info()
+            if dirty_rects is not None:
+                # Include last frame's overlay so shrinking text leaves no stale pixels
+                dirty_rects = dirty_rects + overlay_rects + self._last_overlay_rects
+            self._last_overlay_rects = overlay_rects
+                
+        if dirty_rects is None or self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
         
-    def _render_debug_info(self):
-        """Render debug information overlay"""
+    def _render_debug_info(self) -> list:
+        """
+        Render debug information overlay
+        
+        Returns:
+            Screen rects covered by the overlay
+        """
         fps = self.clock.get_fps()
         fps_text = self.small_font.render(f"FPS: {fps:.1f}", True, (0, 255, 0))
-        self.screen.blit(fps_text, (10, 10))
+        rects = [self.screen.blit(fps_text, (10, 10))]
         
         if self.config['debug_mode']:
             debug_info = [
@@ -114,7 +133,9 @@ class GameEngine:
             
             for i, info in enumerate(debug_info):
                 text = self.small_font.render(info, True, (255, 255, 0))
-                self.screen.blit(text, (10, 40 + i * 20))
+                rects.append(self.screen.blit(text, (10, 40 + i * 20)))
+                
+        return rects
         
     def _cleanup(self):
         """Cleanup resources before exit"""
@@ -130,6 +151,7 @@ class GameEngine:
             
         self.current_game = game_class(self)
         self.game_state = "GAMEPLAY"
+        self._full_redraw = True
         print(f"Switched to game: {game_class.__name__}")
         
     def _return_to_menu(self):
@@ -139,4 +161,5 @@ class GameEngine:
             self.current_game = None
             
         self.game_state = "MENU"
+        self._full_redraw = True
         print("Returned to main menu")
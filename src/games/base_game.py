@@ -46,6 +46,10 @@ class BaseGame(ABC):
         
         Args:
             surface: Pygame surface to render onto
+            
+        Returns:
+            Optionally, the list of screen rects that changed this frame so the
+            engine can update only those; None means the whole screen changed
         """
         pass
         
@@ -21,6 +21,9 @@ class MemoryGame(BaseGame):
         self.last_selection_time = 0
         self.checking_match = False
         
+        # Victory dimming overlay, rebuilt only when the screen size changes
+        self._victory_overlay: Optional[pygame.Surface] = None
+        
         # Theme management
         self.available_themes = self._discover_themes()
         self.current_theme_index = 0 if self.available_themes else -1
@@ -348,8 +351,10 @@ class MemoryGame(BaseGame):
         
     def _draw_victory_overlay(self, surface: pygame.Surface):
         """Draw victory screen overlay"""
-        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Dark overlay
+        overlay = self._victory_overlay
+        if overlay is None or overlay.get_size() != surface.get_size():
+            overlay = self._victory_overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 180))  # Dark overlay
         surface.blit(overlay, (0, 0))
         
         # Victory message
@@ -0,0 +1,169 @@
+"""
+Bit-level kernels for the packed 2048 board.
+
+The board is a single 64-bit integer with one nibble per cell holding the
+tile exponent (0 = empty, 1 = 2, 2 = 4, ...). Cell (i, j) lives at bit
+4 * (4 * i + j), so row i is the 16-bit word at bit 16 * i with column 0
+in its lowest nibble.
+
+The 65536-entry row tables are built once at import. Numba is optional:
+when it is installed the builder is compiled (and cached on disk), and
+without it the same code runs as plain Python.
+"""
+
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+ROW_MASK = 0xFFFF
+MAX_EXPONENT = 15
+
+
+@njit(cache=True)
+def _slide_row(row: int, reverse: bool) -> Tuple[int, int, int]:
+    """
+    Slide and merge one 16-bit row towards column 0 (or column 3 when reversed)
+
+    Returns:
+        Tuple of (new row, score gained, merge mask); bit k of the merge mask
+        is set when column k of the new row was produced by a merge
+    """
+    result = 0
+    score = 0
+    merge_mask = 0
+    target = 0
+    pending = 0
+
+    for step in range(4):
+        column = 3 - step if reverse else step
+        exponent = (row >> (4 * column)) & 0xF
+        if exponent == 0:
+            continue
+
+        if exponent == pending:
+            merged = min(exponent + 1, MAX_EXPONENT)
+            out = 3 - target if reverse else target
+            result |= merged << (4 * out)
+            merge_mask |= 1 << out
+            score += 1 << merged
+            target += 1
+            pending = 0
+        else:
+            if pending:
+                out = 3 - target if reverse else target
+                result |= pending << (4 * out)
+                target += 1
+            pending = exponent
+
+    if pending:
+        out = 3 - target if reverse else target
+        result |= pending << (4 * out)
+
+    return result, score, merge_mask
+
+
+@njit(cache=True)
+def build_row_tables():
+    """
+    Precompute the result of a left and right move for every 16-bit row
+
+    Returns:
+        Tuple of arrays indexed by row: (left result, left score, left merge mask,
+        right result, right score, right merge mask)
+    """
+    row_left = np.zeros(65536, dtype=np.uint16)
+    left_score = np.zeros(65536, dtype=np.uint32)
+    left_merge = np.zeros(65536, dtype=np.uint8)
+    row_right = np.zeros(65536, dtype=np.uint16)
+    right_score = np.zeros(65536, dtype=np.uint32)
+    right_merge = np.zeros(65536, dtype=np.uint8)
+
+    for row in range(65536):
+        row_left[row], left_score[row], left_merge[row] = _slide_row(row, False)
+        row_right[row], right_score[row], right_merge[row] = _slide_row(row, True)
+
+    return row_left, left_score, left_merge, row_right, right_score, right_merge
+
+
+# Plain lists: indexing them from Python yields ints that shift past 16 bits
+(ROW_LEFT, ROW_LEFT_SCORE, ROW_LEFT_MERGE,
+ ROW_RIGHT, ROW_RIGHT_SCORE, ROW_RIGHT_MERGE) = (table.tolist() for table in build_row_tables())
+
+
+# Spread a 4-bit column mask into a row word with a 1 in each flagged nibble
+_MASK_TO_NIBBLES = [sum(1 << (4 * k) for k in range(4) if mask >> k & 1) for mask in range(16)]
+
+
+def transpose(board: int) -> int:
+    """Transpose the 4x4 nibble board so columns become rows"""
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def has_zero_nibble(board: int) -> bool:
+    """Check whether any of the 16 nibbles of a 64-bit word is zero"""
+    return ((board - 0x1111111111111111) & ~board & 0x8888888888888888) != 0
+
+
+def empty_cells(board: int) -> int:
+    """Return a word with a 1 in the nibble of every empty cell"""
+    return ~(board | (board >> 1) | (board >> 2) | (board >> 3)) & 0x1111111111111111
+
+
+# direction -> (vertical, row result table, row score table, row merge table)
+_MOVES = {
+    'left': (False, ROW_LEFT, ROW_LEFT_SCORE, ROW_LEFT_MERGE),
+    'right': (False, ROW_RIGHT, ROW_RIGHT_SCORE, ROW_RIGHT_MERGE),
+    'up': (True, ROW_LEFT, ROW_LEFT_SCORE, ROW_LEFT_MERGE),
+    'down': (True, ROW_RIGHT, ROW_RIGHT_SCORE, ROW_RIGHT_MERGE),
+}
+
+
+def apply_move(board: int, direction: str) -> Tuple[int, int, int]:
+    """
+    Apply a move to a packed board without side effects
+
+    Vertical moves transpose the board so columns can reuse the row tables.
+
+    Args:
+        board: Packed board
+        direction: 'left', 'right', 'up' or 'down'
+
+    Returns:
+        Tuple of (new board, score gained, merges), where merges has a 1 in
+        the nibble of every cell produced by a merge
+    """
+    vertical, moves, scores, merge_masks = _MOVES[direction]
+    if vertical:
+        board = transpose(board)
+
+    new_board = 0
+    score = 0
+    merges = 0
+    for shift in (0, 16, 32, 48):
+        row = (board >> shift) & ROW_MASK
+        new_board |= moves[row] << shift
+        score += scores[row]
+        merges |= _MASK_TO_NIBBLES[merge_masks[row]] << shift
+
+    if vertical:
+        return transpose(new_board), score, transpose(merges)
+    return new_board, score, merges
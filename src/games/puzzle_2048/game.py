@@ -1,8 +1,19 @@
 import pygame
 import random
 import time
+import numpy as np
 from typing import List, Tuple, Optional, Dict
 from ..base_game import BaseGame
+from ._kernels import apply_move, empty_cells, has_zero_nibble
+
+WIN_EXPONENT = 11  # 2048
+WIN_NIBBLES = 0xBBBBBBBBBBBBBBBB  # WIN_EXPONENT in every cell
+
+# Animation kinds stored in the animation type column
+ANIM_SPAWN = 0
+ANIM_MERGE = 1
+ANIM_CAPACITY = 64
+
 
 class Puzzle2048Game(BaseGame):
     """Professional 2048 Puzzle Game with Dark Mode"""
@@ -11,14 +22,39 @@ class Puzzle2048Game(BaseGame):
         super().__init__(engine, "puzzle_2048")
         self.grid_size = 4
         self.cell_size = 100
-        self.grid: List[List[int]] = []
+        self.board = 0  # Packed exponent board, see _kernels
         self.score = 0
         self.best_score = 0
         self.game_over = False
         self.won = False
         self.moved = False
-        self.animations: List[Dict] = []
+        
+        # Active animations as parallel columns; only the first _anim_n slots are live
+        self._anim_type = np.zeros(ANIM_CAPACITY, dtype=np.int8)
+        self._anim_row = np.zeros(ANIM_CAPACITY, dtype=np.int8)
+        self._anim_col = np.zeros(ANIM_CAPACITY, dtype=np.int8)
+        self._anim_exp = np.zeros(ANIM_CAPACITY, dtype=np.int8)
+        self._anim_progress = np.zeros(ANIM_CAPACITY, dtype=np.float32)
+        self._anim_n = 0
         self.dark_mode = True  # Default to dark mode
+        self._credit_cache: Dict[bool, pygame.Surface] = {}  # Rendered credit per mode
+        
+        # Fonts are created once; rendered text is cached per color mode
+        self._fonts = {size: pygame.font.Font(None, size) for size in (48, 40, 36, 32, 24, 20, 16)}
+        self._tile_glyphs: List[Optional[pygame.Surface]] = []
+        self._bg_by_exp: List[Tuple[int, int, int]] = []  # Tile colors indexed by exponent
+        self._fg_by_exp: List[Tuple[int, int, int]] = []
+        self._text_cache: Dict[Tuple[str, int], pygame.Surface] = {}
+        self._score_text: Tuple[int, Optional[pygame.Surface]] = (-1, None)
+        
+        # Static board background, rebuilt only when its geometry or mode changes
+        self._grid_surface: Optional[pygame.Surface] = None
+        self._grid_surface_key: Optional[Tuple[int, int, bool]] = None
+        self._panel_cache: Dict[Tuple[int, int, Tuple[int, ...]], pygame.Surface] = {}
+        
+        # Board position only changes with the window size
+        self._board_pos: Tuple[int, int] = (0, 0)
+        self._last_screen_size: Tuple[int, int] = (-1, -1)
         
         # Dark mode color scheme - professional dark theme
         self.dark_colors = {
@@ -88,16 +124,20 @@ class Puzzle2048Game(BaseGame):
             **{i: (249, 246, 242) for i in [8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096]}
         }
         
+        # Active (colors, tile_colors, text_colors); refreshed only when the mode toggles
+        self._palette = self._get_colors()
+        self._build_palette_caches()
+        
         self.initialize()
         
     def initialize(self):
         """Initialize 2048 game state"""
-        self.grid = [[0 for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        self.board = 0
         self.score = 0
         self.game_over = False
         self.won = False
         self.moved = False
-        self.animations = []
+        self._anim_n = 0
         
         # Add two initial tiles
         self._add_random_tile()
@@ -105,33 +145,46 @@ class Puzzle2048Game(BaseGame):
         
     def _add_random_tile(self):
         """Add a random tile (90% 2, 10% 4) to empty cell"""
-        empty_cells = [
-            (i, j) 
-            for i in range(self.grid_size) 
-            for j in range(self.grid_size) 
-            if self.grid[i][j] == 0
-        ]
-        
-        if empty_cells:
-            i, j = random.choice(empty_cells)
-            self.grid[i][j] = 2 if random.random() < 0.9 else 4
+        empty = empty_cells(self.board)
+        
+        if empty:
+            # Pick the k-th empty cell by clearing the k lowest set bits
+            for _ in range(random.randrange(bin(empty).count('1'))):
+                empty &= empty - 1
+            bit = (empty & -empty).bit_length() - 1
+            exponent = 1 if random.random() < 0.9 else 2
+            self.board |= exponent << bit
             
             # Add spawn animation
-            self.animations.append({
-                'type': 'spawn',
-                'position': (i, j),
-                'value': self.grid[i][j],
-                'progress': 0.0
-            })
+            i, j = divmod(bit >> 2, 4)
+            self._push_anim(ANIM_SPAWN, i, j, exponent)
+            
+    def _push_anim(self, anim_type: int, i: int, j: int, exponent: int):
+        """Start an animation on cell (i, j); dropped if all slots are busy"""
+        n = self._anim_n
+        if n < ANIM_CAPACITY:
+            self._anim_type[n] = anim_type
+            self._anim_row[n] = i
+            self._anim_col[n] = j
+            self._anim_exp[n] = exponent
+            self._anim_progress[n] = 0.0
+            self._anim_n = n + 1
         
     def update(self, delta_time: float):
         """Update game logic and animations"""
         # Update animations
-        for animation in self.animations[:]:
-            animation['progress'] += delta_time * 8  # Animation speed
+        n = self._anim_n
+        if n:
+            progress = self._anim_progress[:n]
+            progress += delta_time * 8  # Animation speed
             
-            if animation['progress'] >= 1.0:
-                self.animations.remove(animation)
+            # Compact the live animations to the front, keeping their order
+            keep = np.flatnonzero(progress < 1.0)
+            if len(keep) != n:
+                for column in (self._anim_type, self._anim_row, self._anim_col,
+                               self._anim_exp, self._anim_progress):
+                    column[:len(keep)] = column[keep]
+                self._anim_n = len(keep)
                 
     def render(self, surface: pygame.Surface):
         """Render 2048 game"""
@@ -159,185 +212,81 @@ class Puzzle2048Game(BaseGame):
                 self.initialize()  # Restart
             elif event.key == pygame.K_m:  # Toggle dark mode
                 self.dark_mode = not self.dark_mode
+                self._palette = self._get_colors()
+                self._build_palette_caches()
                 print(f"🌙 Dark mode: {self.dark_mode}")
             elif event.key == pygame.K_ESCAPE:
                 self.engine._return_to_menu()
                 
     def _move_tiles(self, direction: str):
         """Move tiles in specified direction and handle merging"""
-        old_grid = [row[:] for row in self.grid]  # Copy for comparison
-        self.moved = False
-        
-        if direction == 'left':
-            self._move_left()
-        elif direction == 'right':
-            self._move_right()
-        elif direction == 'up':
-            self._move_up()
-        elif direction == 'down':
-            self._move_down()
-            
-        # Check if movement occurred
-        if self.grid != old_grid:
-            self.moved = True
+        new_board, score, merges = apply_move(self.board, direction)
+        
+        # Only commit the move if something actually shifted
+        self.moved = new_board != self.board
+        if self.moved:
+            self.board = new_board
+            self.score += score
+            self._emit_merge_animations(merges)
             self._add_random_tile()
             self._check_game_state()
             
-    def _move_left(self):
-        """Move and merge tiles to the left"""
-        for i in range(self.grid_size):
-            # Remove zeros and merge
-            row = [cell for cell in self.grid[i] if cell != 0]
-            merged = []
-            skip = False
-            
-            for j in range(len(row)):
-                if skip:
-                    skip = False
-                    continue
-                    
-                if j + 1 < len(row) and row[j] == row[j + 1]:
-                    # Merge tiles
-                    new_value = row[j] * 2
-                    merged.append(new_value)
-                    self.score += new_value
-                    skip = True
-                    
-                    # Add merge animation
-                    self.animations.append({
-                        'type': 'merge',
-                        'position': (i, len(merged) - 1),
-                        'value': new_value,
-                        'progress': 0.0
-                    })
-                else:
-                    merged.append(row[j])
-            
-            # Fill remaining with zeros
-            merged.extend([0] * (self.grid_size - len(merged)))
-            self.grid[i] = merged
-            
-    def _move_right(self):
-        """Move and merge tiles to the right"""
-        for i in range(self.grid_size):
-            row = [cell for cell in self.grid[i] if cell != 0]
-            merged = []
-            skip = False
-            
-            for j in range(len(row) - 1, -1, -1):
-                if skip:
-                    skip = False
-                    continue
-                    
-                if j - 1 >= 0 and row[j] == row[j - 1]:
-                    new_value = row[j] * 2
-                    merged.insert(0, new_value)
-                    self.score += new_value
-                    skip = True
-                    
-                    self.animations.append({
-                        'type': 'merge',
-                        'position': (i, self.grid_size - len(merged)),
-                        'value': new_value,
-                        'progress': 0.0
-                    })
-                else:
-                    merged.insert(0, row[j])
-            
-            merged = [0] * (self.grid_size - len(merged)) + merged
-            self.grid[i] = merged
-            
-    def _move_up(self):
-        """Move and merge tiles upward"""
-        for j in range(self.grid_size):
-            column = [self.grid[i][j] for i in range(self.grid_size) if self.grid[i][j] != 0]
-            merged = []
-            skip = False
-            
-            for i in range(len(column)):
-                if skip:
-                    skip = False
-                    continue
-                    
-                if i + 1 < len(column) and column[i] == column[i + 1]:
-                    new_value = column[i] * 2
-                    merged.append(new_value)
-                    self.score += new_value
-                    skip = True
-                    
-                    self.animations.append({
-                        'type': 'merge',
-                        'position': (len(merged) - 1, j),
-                        'value': new_value,
-                        'progress': 0.0
-                    })
-                else:
-                    merged.append(column[i])
-            
-            merged.extend([0] * (self.grid_size - len(merged)))
-            for i in range(self.grid_size):
-                self.grid[i][j] = merged[i]
-                
-    def _move_down(self):
-        """Move and merge tiles downward"""
-        for j in range(self.grid_size):
-            column = [self.grid[i][j] for i in range(self.grid_size) if self.grid[i][j] != 0]
-            merged = []
-            skip = False
-            
-            for i in range(len(column) - 1, -1, -1):
-                if skip:
-                    skip = False
-                    continue
-                    
-                if i - 1 >= 0 and column[i] == column[i - 1]:
-                    new_value = column[i] * 2
-                    merged.insert(0, new_value)
-                    self.score += new_value
-                    skip = True
-                    
-                    self.animations.append({
-                        'type': 'merge',
-                        'position': (self.grid_size - len(merged), j),
-                        'value': new_value,
-                        'progress': 0.0
-                    })
-                else:
-                    merged.insert(0, column[i])
-            
-            merged = [0] * (self.grid_size - len(merged)) + merged
-            for i in range(self.grid_size):
-                self.grid[i][j] = merged[i]
+    def _emit_merge_animations(self, merges: int):
+        """Start a merge animation on every cell flagged in a merge word"""
+        while merges:
+            bit = (merges & -merges).bit_length() - 1
+            i, j = divmod(bit >> 2, 4)
+            self._push_anim(ANIM_MERGE, i, j, (self.board >> bit) & 0xF)
+            merges &= merges - 1
                 
     def _check_game_state(self):
         """Check if game is won or lost"""
-        # Check for 2048 tile (win condition)
+        board = self.board
+        
+        # Check for 2048 tile (win condition): XOR turns matching nibbles into zeros
         if not self.won:
-            for row in self.grid:
-                if 2048 in row:
-                    self.won = True
-                    break
-        
-        # Check for game over (no moves left)
-        if not any(0 in row for row in self.grid):
-            # Check if any adjacent tiles can be merged
-            game_over = True
-            
-            # Check horizontal merges
-            for i in range(self.grid_size):
-                for j in range(self.grid_size - 1):
-                    if self.grid[i][j] == self.grid[i][j + 1]:
-                        game_over = False
-                        break
-            
-            # Check vertical merges
-            for j in range(self.grid_size):
-                for i in range(self.grid_size - 1):
-                    if self.grid[i][j] == self.grid[i + 1][j]:
-                        game_over = False
-                        break
-                        
-            self.game_over = game_over
+            self.won = has_zero_nibble(board ^ WIN_NIBBLES)
+        
+        # Game over when there is no empty cell and no equal neighbor pair.
+        # Neighbor XORs are zero where tiles match; the nibbles that would compare
+        # across a row edge (or past the last row) are forced non-zero.
+        horizontal = (board ^ (board >> 4)) | 0xF000F000F000F000
+        vertical = (board ^ (board >> 16)) | 0xFFFF000000000000
+        self.game_over = not (has_zero_nibble(board) or
+                              has_zero_nibble(horizontal) or
+                              has_zero_nibble(vertical))
+        
+    def _build_palette_caches(self):
+        """Index the active tile colors by exponent, pre-render glyphs and drop stale UI text"""
+        _, tile_colors, text_colors = self._palette
+        
+        # Exponents past 12 (4096) share its colors
+        self._bg_by_exp = [tile_colors[0]] + [tile_colors[1 << min(exp, 12)] for exp in range(1, 16)]
+        self._fg_by_exp = [text_colors[2]] + [text_colors[1 << min(exp, 12)] for exp in range(1, 16)]
+        self._tile_glyphs = [None] + [
+            self._tile_font(1 << exp).render(str(1 << exp), True, self._fg_by_exp[exp])
+            for exp in range(1, 16)
+        ]
+        self._text_cache = {}
+        self._score_text = (-1, None)
+        
+    def _tile_font(self, value: int) -> pygame.font.Font:
+        """Choose tile font based on value length"""
+        if value < 100:
+            return self._fonts[48]
+        elif value < 1000:
+            return self._fonts[40]
+        return self._fonts[32]
+        
+    def _get_text(self, text: str, size: int) -> pygame.Surface:
+        """Get a cached rendering of static UI text in the current mode"""
+        key = (text, size)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            colors, _, _ = self._palette
+            text_surface = self._fonts[size].render(text, True, colors['text_light'])
+            self._text_cache[key] = text_surface
+        return text_surface
         
     def _get_colors(self):
         """Get current color scheme based on dark mode"""
@@ -348,67 +297,74 @@ class Puzzle2048Game(BaseGame):
         
     def _draw_background(self, surface: pygame.Surface):
         """Draw game background"""
-        colors, _, _ = self._get_colors()
-        surface.fill(colors['background'])
+        colors, _, _ = self._palette
+        # The engine has already cleared the frame; only repaint if our background differs
+        if colors['background'] != self.engine.clear_color:
+            surface.fill(colors['background'])
         
     def _draw_grid(self, surface: pygame.Surface):
         """Draw 2048 grid"""
         board_x, board_y = self._get_board_position()
-        colors, _, _ = self._get_colors()
+        
+        key = (self.cell_size, self.grid_size, self.dark_mode)
+        if key != self._grid_surface_key:
+            self._grid_surface = self._render_grid_surface()
+            self._grid_surface_key = key
+            
+        surface.blit(self._grid_surface, (board_x - 10, board_y - 10))
+        
+    def _render_grid_surface(self) -> pygame.Surface:
+        """Render the board background and empty cells into a standalone surface"""
+        colors, _, _ = self._palette
+        board_size = self.grid_size * self.cell_size + 20
+        grid_surface = pygame.Surface((board_size, board_size), pygame.SRCALPHA)
         
         # Draw grid background
-        board_rect = pygame.Rect(
-            board_x - 10, board_y - 10,
-            self.grid_size * self.cell_size + 20,
-            self.grid_size * self.cell_size + 20
-        )
-        pygame.draw.rect(surface, colors['grid_bg'], board_rect, border_radius=8)
+        pygame.draw.rect(grid_surface, colors['grid_bg'], grid_surface.get_rect(), border_radius=8)
         
-        # Draw cell backgrounds
+        # Draw cell backgrounds (offset by the 10px board margin)
         for i in range(self.grid_size):
             for j in range(self.grid_size):
                 cell_rect = pygame.Rect(
-                    board_x + j * self.cell_size + 6,
-                    board_y + i * self.cell_size + 6,
+                    j * self.cell_size + 16,
+                    i * self.cell_size + 16,
                     self.cell_size - 12,
                     self.cell_size - 12
                 )
-                pygame.draw.rect(surface, colors['empty_cell'], cell_rect, border_radius=4)
+                pygame.draw.rect(grid_surface, colors['empty_cell'], cell_rect, border_radius=4)
+                
+        return grid_surface
                 
     def _draw_tiles(self, surface: pygame.Surface):
         """Draw all tiles with animations"""
         board_x, board_y = self._get_board_position()
-        _, tile_colors, text_colors = self._get_colors()
+        board = self.board
         
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                value = self.grid[i][j]
-                if value > 0:
-                    self._draw_tile(surface, board_x, board_y, i, j, value, tile_colors, text_colors)
+        for cell in range(16):
+            exponent = (board >> (4 * cell)) & 0xF
+            if exponent:
+                i, j = divmod(cell, 4)
+                self._draw_tile(surface, board_x, board_y, i, j, exponent)
                     
         # Draw animations
-        for animation in self.animations:
-            i, j = animation['position']
-            value = animation['value']
-            progress = animation['progress']
+        for k in range(self._anim_n):
+            i = int(self._anim_row[k])
+            j = int(self._anim_col[k])
+            exponent = int(self._anim_exp[k])
+            progress = float(self._anim_progress[k])
             
-            if animation['type'] == 'spawn':
+            if self._anim_type[k] == ANIM_SPAWN:
                 # Scale animation
                 scale = progress
-                self._draw_tile(surface, board_x, board_y, i, j, value, tile_colors, text_colors, scale)
-            elif animation['type'] == 'merge':
+                self._draw_tile(surface, board_x, board_y, i, j, exponent, scale)
+            else:
                 # Pulse animation
                 pulse = 1.0 + 0.1 * (1.0 - abs(progress - 0.5) * 2)
-                self._draw_tile(surface, board_x, board_y, i, j, value, tile_colors, text_colors, pulse)
+                self._draw_tile(surface, board_x, board_y, i, j, exponent, pulse)
                     
     def _draw_tile(self, surface: pygame.Surface, board_x: int, board_y: int, 
-                  i: int, j: int, value: int, tile_colors: Dict, text_colors: Dict, scale: float = 1.0):
+                  i: int, j: int, exponent: int, scale: float = 1.0):
         """Draw individual tile"""
-        # Get color based on value
-        color_key = min(value, 4096)  # Cap at 4096 for colors
-        bg_color = tile_colors.get(color_key, tile_colors[4096])
-        text_color = text_colors.get(color_key, text_colors[4096])
-        
         # Calculate tile size with animation scale
         base_size = self.cell_size - 12
         animated_size = int(base_size * scale)
@@ -422,62 +378,49 @@ class Puzzle2048Game(BaseGame):
         )
         
         # Draw tile background
-        pygame.draw.rect(surface, bg_color, tile_rect, border_radius=4)
+        pygame.draw.rect(surface, self._bg_by_exp[exponent], tile_rect, border_radius=4)
         
         # Draw tile value
-        if value > 0:
-            # Choose font size based on value length
-            if value < 100:
-                font_size = 48
-            elif value < 1000:
-                font_size = 40
-            else:
-                font_size = 32
-                
-            font = pygame.font.Font(None, font_size)
-            text = font.render(str(value), True, text_color)
-            text_rect = text.get_rect(center=tile_rect.center)
-            surface.blit(text, text_rect)
+        text = self._tile_glyphs[exponent]
+        text_rect = text.get_rect(center=tile_rect.center)
+        surface.blit(text, text_rect)
         
     def _draw_ui(self, surface: pygame.Surface):
         """Draw game UI"""
         board_x, board_y = self._get_board_position()
-        colors, _, _ = self._get_colors()
+        colors, _, _ = self._palette
         
         # Score panel
         score_panel = pygame.Rect(board_x, 30, 200, 80)
         self._draw_glass_panel(surface, score_panel, colors)
         
         # Score text
-        score_font = pygame.font.Font(None, 32)
-        title_font = pygame.font.Font(None, 24)
-        
-        title_text = title_font.render("SCORE", True, colors['text_light'])
-        score_text = score_font.render(str(self.score), True, colors['text_light'])
+        title_text = self._get_text("SCORE", 24)
+        score_value, score_text = self._score_text
+        if score_value != self.score or score_text is None:
+            score_text = self._fonts[32].render(str(self.score), True, colors['text_light'])
+            self._score_text = (self.score, score_text)
         
         surface.blit(title_text, (board_x + 20, 45))
         surface.blit(score_text, (board_x + 20, 70))
         
         # Dark mode indicator
-        mode_font = pygame.font.Font(None, 20)
-        mode_text = mode_font.render(f"Mode: {'Dark' if self.dark_mode else 'Light'} (M)", True, colors['text_light'])
+        mode_text = self._get_text(f"Mode: {'Dark' if self.dark_mode else 'Light'} (M)", 20)
         surface.blit(mode_text, (board_x + 220, 50))
         
         # Game state messages
-        message_font = pygame.font.Font(None, 36)
         if self.won and not self.game_over:
-            message_text = message_font.render("You Win! Press R to restart", True, colors['text_light'])
+            message_text = self._get_text("You Win! Press R to restart", 36)
             surface.blit(message_text, 
                         (surface.get_width() // 2 - message_text.get_width() // 2, 
                          board_y + self.grid_size * self.cell_size + 30))
         elif self.game_over:
-            message_text = message_font.render("Game Over! Press R to restart", True, colors['text_light'])
+            message_text = self._get_text("Game Over! Press R to restart", 36)
             surface.blit(message_text,
                         (surface.get_width() // 2 - message_text.get_width() // 2,
                          board_y + self.grid_size * self.cell_size + 30))
         
         # Instructions
-        instruction_font = pygame.font.Font(None, 20)
         instructions = [
             "Use ARROW KEYS or WASD to move tiles",
             "Combine tiles to reach 2048",
@@ -485,13 +428,17 @@ class Puzzle2048Game(BaseGame):
         ]
         
         for idx, instruction in enumerate(instructions):
-            text = instruction_font.render(instruction, True, colors['text_light'])
+            text = self._get_text(instruction, 20)
             surface.blit(text, (20, surface.get_height() - 80 + idx * 22))
                 
     def _draw_glass_panel(self, surface: pygame.Surface, rect: pygame.Rect, colors: Dict):
         """Draw glass effect panel"""
-        panel_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        panel_surface.fill(colors['panel_bg'])
+        key = (rect.width, rect.height, colors['panel_bg'])
+        panel_surface = self._panel_cache.get(key)
+        if panel_surface is None:
+            panel_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+            panel_surface.fill(colors['panel_bg'])
+            self._panel_cache[key] = panel_surface
         surface.blit(panel_surface, rect)
         
         # Border
@@ -499,12 +446,14 @@ class Puzzle2048Game(BaseGame):
                 
     def _draw_developer_credit(self, surface: pygame.Surface):
         """Render professional developer credit"""
-        colors, _, _ = self._get_colors()
-        credit_font = pygame.font.Font(None, 16)
-        credit_text = "Developed by Gustavo Viana"
-        
-        text_surface = credit_font.render(credit_text, True, colors['text_light'])
-        text_surface.set_alpha(180)
+        text_surface = self._credit_cache.get(self.dark_mode)
+        if text_surface is None:
+            colors, _, _ = self._palette
+            credit_text = "Developed by Gustavo Viana"
+            
+            text_surface = self._fonts[16].render(credit_text, True, colors['text_light'])
+            text_surface.set_alpha(180)
+            self._credit_cache[self.dark_mode] = text_surface
         
         text_rect = text_surface.get_rect()
         text_rect.bottomright = (surface.get_width() - 15, surface.get_height() - 15)
@@ -513,9 +462,14 @@ class Puzzle2048Game(BaseGame):
         
     def _get_board_position(self) -> Tuple[int, int]:
         """Calculate board position to center it on screen"""
-        board_width = self.grid_size * self.cell_size
-        board_height = self.grid_size * self.cell_size
-        board_x = (self.engine.screen.get_width() - board_width) // 2
-        board_y = (self.engine.screen.get_height() - board_height) // 2 + 20
-        
-        return board_x, board_y
+        screen_size = self.engine.screen.get_size()
+        if screen_size != self._last_screen_size:
+            board_width = self.grid_size * self.cell_size
+            board_height = self.grid_size * self.cell_size
+            board_x = (screen_size[0] - board_width) // 2
+            board_y = (screen_size[1] - board_height) // 2 + 20
+            
+            self._board_pos = (board_x, board_y)
+            self._last_screen_size = screen_size
+            
+        return self._board_pos
@@ -0,0 +1,87 @@
+"""
+Compiled kernels for the sliding puzzle.
+
+The grid is a flat uint8 array in row-major order with cell (i, j) at
+i * n + j, tile values 1..n*n-1 and 0 for the empty cell. Numba is
+optional: callers check NUMBA_AVAILABLE and keep their pure-Python path
+when it is missing, since the kernel run as plain Python would be slower
+than the list-based code it replaces.
+"""
+
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def shuffle_grid(grid: np.ndarray, n: int, empty: int, steps: int,
+                 manhattan: int, target_distance: int, seed: int) -> Tuple[int, int]:
+    """
+    Scramble the grid in place with a random walk of the empty cell
+
+    The walk never steps straight back into the cell it just left and stops
+    early once the summed Manhattan distance reaches target_distance.
+
+    Args:
+        grid: Flat uint8 grid, modified in place
+        n: Grid side length
+        empty: Flat index of the empty cell
+        steps: Maximum number of moves
+        manhattan: Summed Manhattan distance of the tiles before the walk
+        target_distance: Distance at which the grid counts as scrambled
+        seed: Non-zero 32-bit xorshift seed
+
+    Returns:
+        Tuple of (flat index of the empty cell, summed Manhattan distance)
+    """
+    state = seed & 0xFFFFFFFF
+    previous = -1
+
+    for _ in range(steps):
+        if manhattan >= target_distance:
+            break
+
+        empty_i = empty // n
+        empty_j = empty % n
+        while True:
+            state ^= (state << 13) & 0xFFFFFFFF
+            state ^= state >> 17
+            state ^= (state << 5) & 0xFFFFFFFF
+            direction = state & 3
+            tile_i = empty_i
+            tile_j = empty_j
+            if direction == 0:
+                tile_j += 1
+            elif direction == 1:
+                tile_i += 1
+            elif direction == 2:
+                tile_j -= 1
+            else:
+                tile_i -= 1
+            target = tile_i * n + tile_j
+            if 0 <= tile_i < n and 0 <= tile_j < n and target != previous:
+                break
+
+        value = int(grid[target])
+        grid[empty] = value
+        grid[target] = 0
+
+        goal_i = (value - 1) // n
+        goal_j = (value - 1) % n
+        manhattan += (abs(empty_i - goal_i) + abs(empty_j - goal_j)
+                      - abs(tile_i - goal_i) - abs(tile_j - goal_j))
+        previous = empty
+        empty = target
+
+    return empty, manhattan
@@ -2,10 +2,25 @@ import pygame
 import random
 import time
 import os
+import numpy as np
 from typing import List, Tuple, Optional, Dict
 from ..base_game import BaseGame
+from ._kernels import NUMBA_AVAILABLE, shuffle_grid
+
+class _SlideAnim:
+    # One tile moving from (from_i, from_j) into the empty cell at (to_i, to_j)
+    __slots__ = ('from_i', 'from_j', 'to_i', 'to_j', 'progress')
+    
+    def __init__(self, from_i, from_j, to_i, to_j):
+        self.from_i = from_i
+        self.from_j = from_j
+        self.to_i = to_i
+        self.to_j = to_j
+        self.progress = 0.0
 
 class SlidingPuzzleGame(BaseGame):
+    _stats_panel = pygame.Rect(20, 20, 280, 140)
+    
     def __init__(self, engine):
         super().__init__(engine, "sliding")
         self.levels = {
@@ -16,16 +31,44 @@ class SlidingPuzzleGame(BaseGame):
         self.current_level = "Facil"
         self.grid_size = self.levels[self.current_level]
         self.cell_size = 500 // self.grid_size
-        self.grid = []
-        self.solved_grid = []
+        self.grid = bytearray()  # Row-major, cell (i, j) at i * grid_size + j
+        self.solved_grid = b''  # Immutable goal state for the current size
         self.empty_pos = (0, 0)
+        self._goal_pos = []  # Solved (i, j) of each tile value; index 0 unused
+        self._manhattan = 0  # Sum of tile distances to their goal cells
+        self._mismatch = 0  # Cells that differ from solved_grid
+        self._neighbors = []  # Flat indices orthogonally adjacent to each flat cell
         self.moves = 0
         self.game_started = False
         self.game_complete = False
         self.start_time = 0
         self.elapsed_time = 0
-        self.animations = []
+        self._anim = None  # The single tile slide in flight, if any
         self.show_numbers = True
+        self.tile_surfaces = {}
+        self._composed_tiles = []  # Finished tile art per value; index 0 unused
+        self._numbered_tiles = []  # Same art with the value's number baked in
+        self._tile_cache_key = None
+        self._board_surface = None
+        self._board_dirty = True
+        self._fonts = {size: pygame.font.Font(None, size) for size in (16, 20, 24, 28, 32, 36, 48)}
+        self._text_cache = {}
+        self._glass_cache = {}
+        self._win_overlay = None
+        self._solved_frame = None
+        self._background = None
+        self._background_key = None
+        self._tile_rects = []
+        self._slide_rect = None
+        self._board_pos = (0, 0)
+        self._last_screen_size = None
+        self._board_redrawn = True
+        self._dirty_cells = set()  # Flat cell indices changed since the last frame
+        self._full_board_dirty = True  # Every cell changed (new game, level, number toggle)
+        self._anim_rect = None
+        self._last_anim_rect = None
+        self._last_frame_key = None
+        self._last_stats = None
         
         self.colors = {
             'background': (25, 25, 40),
@@ -43,13 +86,23 @@ class SlidingPuzzleGame(BaseGame):
 
     def _create_geometric_image(self):
         size = 800
-        self.current_image = pygame.Surface((size, size))
         colors = [(70, 130, 180), (100, 150, 200), (130, 170, 220), (160, 190, 240)]
         
+        # Squared distance of every pixel centre from the middle, broadcast from a column and a row
+        x, y = np.ogrid[:size, :size]
+        dx = x - size / 2 + 0.5
+        dy = y - size / 2 + 0.5
+        distance_sq = dx * dx + dy * dy
+        
+        pixels = np.zeros((size, size, 3), dtype=np.uint8)
         for i in range(4):
             radius = size // 2 - i * 80
-            color = colors[i]
-            pygame.draw.circle(self.current_image, color, (size // 2, size // 2), radius)
+            pixels[distance_sq <= radius * radius] = colors[i]
+        self.current_image = pygame.surfarray.make_surface(pixels)
+            
+        # Match the display pixel format so segments derived from it blit without conversion
+        if pygame.display.get_surface() is not None:
+            self.current_image = self.current_image.convert()
             
         self.image_loaded = True
 
@@ -57,20 +110,20 @@ class SlidingPuzzleGame(BaseGame):
         self.grid_size = self.levels[self.current_level]
         self.cell_size = 500 // self.grid_size
         
-        self.solved_grid = []
-        value = 1
-        for i in range(self.grid_size):
-            row = []
-            for j in range(self.grid_size):
-                if i == self.grid_size - 1 and j == self.grid_size - 1:
-                    row.append(0)
-                else:
-                    row.append(value)
-                    value += 1
-            self.solved_grid.append(row)
+        self.solved_grid = bytes(range(1, self.grid_size * self.grid_size)) + b'\x00'
         
-        self.grid = [row[:] for row in self.solved_grid]
+        self.grid = bytearray(self.solved_grid)
         self.empty_pos = (self.grid_size - 1, self.grid_size - 1)
+        self._goal_pos = [divmod(value - 1, self.grid_size) for value in range(self.grid_size * self.grid_size)]
+        self._manhattan = 0
+        self._mismatch = 0
+        n = self.grid_size
+        self._neighbors = [
+            tuple(ni * n + nj for ni, nj in ((i, j + 1), (i + 1, j), (i, j - 1), (i - 1, j))
+                  if 0 <= ni < n and 0 <= nj < n)
+            for i in range(n)
+            for j in range(n)
+        ]
         self._shuffle_puzzle()
         
         self.moves = 0
@@ -78,52 +131,250 @@ class SlidingPuzzleGame(BaseGame):
         self.game_complete = False
         self.start_time = time.time()
         self.elapsed_time = 0
-        self.animations = []
+        self._anim = None
+        self._solved_frame = None
+        self._rebuild_tile_cache()
+        self._board_dirty = True
+        self._full_board_dirty = True
+        self._last_screen_size = None
+        
+        # Tile rects in board-surface coordinates (10px margin), indexed by i * grid_size + j
+        cs = self.cell_size
+        self._slide_rect = pygame.Rect(0, 0, cs - 4, cs - 4)
+        self._tile_rects = [
+            pygame.Rect(10 + j * cs + 2, 10 + i * cs + 2, cs - 4, cs - 4)
+            for i in range(self.grid_size)
+            for j in range(self.grid_size)
+        ]
+        
+        # Warm the tile number glyphs for this grid size
+        for value in range(1, self.grid_size * self.grid_size):
+            self._text(str(value), self._tile_font_size(), self.colors['text_light'])
 
-    def _shuffle_puzzle(self):
-        for _ in range(100 * self.grid_size * self.grid_size):
-            possible_moves = self._get_possible_moves()
-            if possible_moves:
-                move = random.choice(possible_moves)
-                self._slide_tile(move)
+    def _font(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self._fonts[size] = font
+        return font
+        
+    def _text(self, text, size, color):
+        # Rendered text is memoized; counters only change once per move or second
+        key = (text, size, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            if len(self._text_cache) > 256:
+                self._text_cache.clear()
+            text_surface = self._font(size).render(text, True, color)
+            if pygame.display.get_surface() is not None:
+                text_surface = text_surface.convert_alpha()
+            self._text_cache[key] = text_surface
+        return text_surface
+        
+    def _tile_font_size(self):
+        return max(20, self.cell_size // 4)
+        
+    def _rebuild_tile_cache(self):
+        # Image segments only depend on the grid size, so slice and scale them once
+        key = (self.grid_size, self.cell_size)
+        if key == self._tile_cache_key:
+            return
+            
+        self.tile_surfaces = {}
+        self._tile_cache_key = key
+        if not (self.image_loaded and self.current_image):
+            return
+            
+        img_cell_size = self.current_image.get_width() // self.grid_size
+        can_convert = pygame.display.get_surface() is not None
+        for i in range(self.grid_size):
+            for j in range(self.grid_size):
+                src_rect = pygame.Rect(
+                    j * img_cell_size,
+                    i * img_cell_size,
+                    img_cell_size,
+                    img_cell_size
+                )
+                segment = self.current_image.subsurface(src_rect)
+                # Nearest-neighbor is enough here; the 2px tile border hides the edge aliasing
+                segment = pygame.transform.scale(segment, (self.cell_size - 4, self.cell_size - 4))
+                self.tile_surfaces[(i, j)] = segment.convert() if can_convert else segment
                 
-    def _get_possible_moves(self):
+        # Each value carries the image segment of the cell it belongs to when solved
+        self._composed_tiles = [None] + [
+            self._compose_tile(*divmod(value - 1, self.grid_size))
+            for value in range(1, self.grid_size * self.grid_size)
+        ]
+        # The number on a tile depends only on its value, so H just switches lists
+        self._numbered_tiles = [None] + [
+            self._number_tile(self._composed_tiles[value], value)
+            for value in range(1, self.grid_size * self.grid_size)
+        ]
+        
+    def _number_tile(self, tile, value):
+        tile = tile.copy()
+        text = self._text(str(value), self._tile_font_size(), self.colors['text_light'])
+        tile.blit(text, text.get_rect(center=tile.get_rect().center))
+        return tile
+        
+    def _compose_tile(self, goal_i, goal_j):
+        tile_size = self.cell_size - 4
+        tile = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+        tile_rect = tile.get_rect()
+        
+        pygame.draw.rect(tile, self.colors['tile_bg'], tile_rect, border_radius=6)
+        segment = self.tile_surfaces.get((goal_i, goal_j))
+        if segment is not None:
+            tile.blit(segment, tile_rect)
+        pygame.draw.rect(tile, self.colors['tile_border'], tile_rect, 2, border_radius=6)
+        
+        if pygame.display.get_surface() is not None:
+            tile = tile.convert_alpha()
+        return tile
+
+    def _shuffle_puzzle(self):
+        # Hot names bound to locals for the 100 * N^2 step loop
+        n = self.grid_size
+        randrange = random.randrange
+        slide = self._slide_tile
+        neighbors = self._neighbors
         empty_i, empty_j = self.empty_pos
-        moves = []
-        
-        for di, dj in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            new_i, new_j = empty_i + di, empty_j + dj
-            if 0 <= new_i < self.grid_size and 0 <= new_j < self.grid_size:
-                moves.append((new_i, new_j))
+        empty = empty_i * n + empty_j
+        previous = -1
+        
+        # Stop once the board is as scrambled as a uniformly random one, whose summed
+        # Manhattan distance averages 2 * (N^2 - 1)^2 / (3N), instead of running every step
+        target_distance = -(-2 * (n * n - 1) ** 2 // (3 * n))
+        
+        if NUMBA_AVAILABLE:
+            # Same walk in machine code, seeded from random so random.seed() still reproduces it
+            cells = np.frombuffer(self.grid, dtype=np.uint8)
+            empty, self._manhattan = shuffle_grid(cells, n, empty, 100 * n * n, self._manhattan,
+                                                  target_distance, random.getrandbits(32) | 1)
+            del cells
+            self.empty_pos = divmod(empty, n)
+            self._mismatch = sum(a != b for a, b in zip(self.grid, self.solved_grid))
+            return
+            
+        for _ in range(100 * n * n):
+            if self._manhattan >= target_distance:
+                break
+                
+            # Redraw instead of stepping back into the cell the empty space just left
+            options = neighbors[empty]
+            target = options[randrange(len(options))]
+            while target == previous:
+                target = options[randrange(len(options))]
+                
+            slide(divmod(target, n))
+            previous, empty = empty, target
                 
-        return moves
-        
     def _slide_tile(self, tile_pos):
         tile_i, tile_j = tile_pos
         empty_i, empty_j = self.empty_pos
         
-        self.grid[empty_i][empty_j] = self.grid[tile_i][tile_j]
-        self.grid[tile_i][tile_j] = 0
+        n = self.grid_size
+        grid = self.grid
+        solved = self.solved_grid
+        tile_index = tile_i * n + tile_j
+        empty_index = empty_i * n + empty_j
+        value = grid[tile_index]
+        
+        # Only these two cells change, so the mismatch count is adjusted in place
+        before = (grid[tile_index] != solved[tile_index]) + (grid[empty_index] != solved[empty_index])
+        grid[empty_index] = value
+        grid[tile_index] = 0
+        self._mismatch += (value != solved[empty_index]) + (solved[tile_index] != 0) - before
+        
+        goal_i, goal_j = self._goal_pos[value]
+        self._manhattan += (abs(empty_i - goal_i) + abs(empty_j - goal_j)
+                            - abs(tile_i - goal_i) - abs(tile_j - goal_j))
         self.empty_pos = (tile_i, tile_j)
+        self._board_dirty = True
+        self._dirty_cells.add(tile_index)
+        self._dirty_cells.add(empty_index)
         
     def update(self, delta_time):
         if self.game_started and not self.game_complete:
             self.elapsed_time = time.time() - self.start_time
             
-        for animation in self.animations[:]:
-            animation['progress'] += delta_time * 6
-            if animation['progress'] >= 1.0:
-                self.animations.remove(animation)
-                
-        if not self.game_complete and self.grid == self.solved_grid:
+        anim = self._anim
+        if anim is not None:
+            anim.progress += delta_time * 6
+            if anim.progress >= 1.0:
+                self._anim = None
+                self._board_dirty = True
+                self._dirty_cells.add(anim.to_i * self.grid_size + anim.to_j)
+                    
+    def _pack(self):
+        # Whole grid as one hashable int, one byte per cell (ready for undo/visited sets)
+        return int.from_bytes(self.grid, 'big')
+        
+    def _check_complete(self):
+        # The grid only changes on a move, so completion is checked right after one
+        if not self.game_complete and self._mismatch == 0:
             self.game_complete = True
             
     def render(self, surface):
-        surface.fill(self.colors['background'])
+        self._anim_rect = None
+        if self.game_complete and self._anim is None:
+            # Nothing moves under the completion overlay, so the whole frame is drawn once
+            size = surface.get_size()
+            if self._solved_frame is None or self._solved_frame.get_size() != size:
+                frame = pygame.Surface(size)
+                if pygame.display.get_surface() is not None:
+                    frame = frame.convert()
+                self._draw_frame(frame)
+                self._solved_frame = frame
+            surface.blit(self._solved_frame, (0, 0))
+        else:
+            self._draw_frame(surface)
+        return self._collect_dirty_rects(surface)
+        
+    def _draw_frame(self, surface):
+        surface.blit(self._get_background(surface), (0, 0))
         self._draw_puzzle(surface)
         self._draw_ui(surface)
         self._draw_developer_credit(surface)
         
+    def _collect_dirty_rects(self, surface):
+        # The frame is always fully drawn, but only the regions that changed need to reach the display
+        frame_key = (surface.get_size(), self.current_level, self.show_numbers, self.game_complete)
+        stats = (self.moves, int(self.elapsed_time))
+        dirty = []
+        
+        if frame_key != self._last_frame_key:
+            dirty.append(surface.get_rect())
+        else:
+            if self._board_redrawn:
+                board_x, board_y = self._get_board_position()
+                cs = self.cell_size
+                if self._full_board_dirty:
+                    size = self.grid_size * cs + 20
+                    dirty.append(pygame.Rect(board_x - 10, board_y - 10, size, size))
+                else:
+                    n = self.grid_size
+                    rect = pygame.Rect
+                    for index in self._dirty_cells:
+                        i, j = divmod(index, n)
+                        dirty.append(rect(board_x + j * cs, board_y + i * cs, cs, cs))
+            if self._last_anim_rect is not None:
+                dirty.append(self._last_anim_rect)
+            if self._anim_rect is not None:
+                dirty.append(self._anim_rect)
+            if stats != self._last_stats:
+                dirty.append(self._stats_panel)
+                
+        self._last_frame_key = frame_key
+        self._last_stats = stats
+        # The sliding rect is reused next frame, so keep a snapshot of where it was
+        self._last_anim_rect = tuple(self._anim_rect) if self._anim_rect is not None else None
+        if self._board_redrawn:
+            self._board_redrawn = False
+            self._full_board_dirty = False
+            self._dirty_cells.clear()
+        return dirty
+        
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if not self.game_complete:
@@ -136,6 +387,9 @@ class SlidingPuzzleGame(BaseGame):
                 self._switch_level()
             elif event.key == pygame.K_h:
                 self.show_numbers = not self.show_numbers
+                self._board_dirty = True
+                self._solved_frame = None
+                self._full_board_dirty = True
             elif event.key == pygame.K_ESCAPE:
                 self.engine._return_to_menu()
                 
@@ -153,189 +407,181 @@ class SlidingPuzzleGame(BaseGame):
         
         if 0 <= grid_x < self.grid_size and 0 <= grid_y < self.grid_size:
             clicked_pos = (grid_y, grid_x)
+            empty_i, empty_j = self.empty_pos
             
-            if clicked_pos in self._get_possible_moves():
+            # Only tiles orthogonally adjacent to the empty cell can move
+            if abs(grid_y - empty_i) + abs(grid_x - empty_j) == 1:
                 if not self.game_started:
                     self.game_started = True
                     self.start_time = time.time()
                     
-                empty_i, empty_j = self.empty_pos
-                self.animations.append({
-                    'type': 'slide',
-                    'from_pos': clicked_pos,
-                    'to_pos': self.empty_pos,
-                    'progress': 0.0
-                })
+                # A new click replaces any slide still in flight; the board cache redraws it at rest
+                if self._anim is not None:
+                    self._dirty_cells.add(self._anim.to_i * self.grid_size + self._anim.to_j)
+                self._anim = _SlideAnim(clicked_pos[0], clicked_pos[1], *self.empty_pos)
                 
                 self._slide_tile(clicked_pos)
                 self.moves += 1
+                self._check_complete()
                 
     def _draw_puzzle(self, surface):
         board_x, board_y = self._get_board_position()
         
-        board_rect = pygame.Rect(
-            board_x - 10, board_y - 10,
-            self.grid_size * self.cell_size + 20,
-            self.grid_size * self.cell_size + 20
-        )
-        pygame.draw.rect(surface, self.colors['grid_bg'], board_rect, border_radius=8)
-        
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                value = self.grid[i][j]
-                if value != 0:
-                    self._draw_tile(surface, board_x, board_y, i, j, value)
+        if self._board_dirty or self._board_surface is None:
+            self._render_board_surface()
+        surface.blit(self._board_surface, (board_x - 10, board_y - 10))
                     
-        for animation in self.animations:
-            if animation['type'] == 'slide':
-                self._draw_sliding_tile(surface, board_x, board_y, animation)
-        
-    def _draw_tile(self, surface, board_x, board_y, i, j, value):
-        tile_rect = pygame.Rect(
-            board_x + j * self.cell_size + 2,
-            board_y + i * self.cell_size + 2,
-            self.cell_size - 4,
-            self.cell_size - 4
-        )
-        
-        pygame.draw.rect(surface, self.colors['tile_bg'], tile_rect, border_radius=6)
-        
-        if self.image_loaded and self.current_image:
-            img_cell_size = self.current_image.get_width() // self.grid_size
-            src_rect = pygame.Rect(
-                j * img_cell_size,
-                i * img_cell_size, 
-                img_cell_size,
-                img_cell_size
-            )
-            
-            segment = self.current_image.subsurface(src_rect)
-            segment = pygame.transform.smoothscale(segment, (self.cell_size - 4, self.cell_size - 4))
-            surface.blit(segment, tile_rect)
-        
-        if self.show_numbers:
-            font_size = max(20, self.cell_size // 4)
-            font = pygame.font.Font(None, font_size)
-            text = font.render(str(value), True, self.colors['text_light'])
-            text_rect = text.get_rect(center=tile_rect.center)
-            surface.blit(text, text_rect)
-            
-        pygame.draw.rect(surface, self.colors['tile_border'], tile_rect, 2, border_radius=6)
+        if self._anim is not None:
+            self._anim_rect = self._draw_sliding_tile(surface, board_x, board_y, self._anim)
+        
+    def _render_board_surface(self):
+        # Static board with every resting tile; only rebuilt after the grid changes
+        size = self.grid_size * self.cell_size + 20
+        board_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(board_surface, self.colors['grid_bg'], board_surface.get_rect(), border_radius=8)
+        
+        # A tile still sliding into place is drawn by its animation instead
+        sliding = self._anim.to_i * self.grid_size + self._anim.to_j if self._anim is not None else -1
+        tiles = self._numbered_tiles if self.show_numbers else self._composed_tiles
+        tile_rects = self._tile_rects
+        
+        # One batched call instead of a Python-level blit per tile
+        board_surface.blits([
+            (tiles[value], tile_rects[index]) for index, value in enumerate(self.grid)
+            if value != 0 and index != sliding
+        ], doreturn=False)
+                    
+        if pygame.display.get_surface() is not None:
+            board_surface = board_surface.convert_alpha()
+        self._board_surface = board_surface
+        self._board_dirty = False
+        self._board_redrawn = True
         
     def _draw_sliding_tile(self, surface, board_x, board_y, animation):
-        from_i, from_j = animation['from_pos']
-        to_i, to_j = animation['to_pos']
-        progress = animation['progress']
+        from_i, from_j = animation.from_i, animation.from_j
+        to_i, to_j = animation.to_i, animation.to_j
+        progress = animation.progress
         
         current_x = from_j + (to_j - from_j) * progress
         current_y = from_i + (to_i - from_i) * progress
         
-        tile_rect = pygame.Rect(
-            board_x + current_x * self.cell_size + 2,
-            board_y + current_y * self.cell_size + 2,
-            self.cell_size - 4,
-            self.cell_size - 4
-        )
+        # Reuse one Rect for the moving tile instead of allocating one per frame
+        cs = self.cell_size
+        tile_rect = self._slide_rect
+        tile_rect.x = int(board_x + current_x * cs + 2)
+        tile_rect.y = int(board_y + current_y * cs + 2)
         
         pygame.draw.rect(surface, (80, 80, 110), tile_rect, border_radius=6)
         
-        if self.image_loaded and self.current_image:
-            img_cell_size = self.current_image.get_width() // self.grid_size
-            src_rect = pygame.Rect(
-                from_j * img_cell_size,
-                from_i * img_cell_size,
-                img_cell_size,
-                img_cell_size
-            )
-            segment = self.current_image.subsurface(src_rect)
-            segment = pygame.transform.smoothscale(segment, (self.cell_size - 4, self.cell_size - 4))
+        value = self.grid[to_i * self.grid_size + to_j]
+        segment = self.tile_surfaces.get(self._goal_pos[value])
+        if segment is not None:
             surface.blit(segment, tile_rect)
         
         if self.show_numbers:
-            value = self.grid[to_i][to_j]
-            font_size = max(20, self.cell_size // 4)
-            font = pygame.font.Font(None, font_size)
-            text = font.render(str(value), True, self.colors['text_light'])
+            text = self._text(str(value), self._tile_font_size(), self.colors['text_light'])
             text_rect = text.get_rect(center=tile_rect.center)
             surface.blit(text, text_rect)
             
         pygame.draw.rect(surface, (120, 120, 160), tile_rect, 2, border_radius=6)
+        return tile_rect
+        
+    def _get_background(self, surface):
+        # Fill plus the chrome that only changes with the window, level or completion
+        key = (surface.get_size(), self.current_level, self.game_complete)
+        if key != self._background_key:
+            background = pygame.Surface(key[0])
+            if pygame.display.get_surface() is not None:
+                background = background.convert()
+            background.fill(self.colors['background'])
+            self._draw_glass_panel(background, self._stats_panel)
+            
+            level_text = self._text(f"Nivel: {self.current_level}", 24, self.colors['text_light'])
+            size_text = self._text(f"Grid: {self.grid_size}x{self.grid_size}", 24, self.colors['text_light'])
+            background.blit(level_text, (35, 30))
+            background.blit(size_text, (35, 55))
+            
+            if not self.game_complete:
+                instructions = [
+                    "Clique nas pecas para move-las para o espaco vazio",
+                    "Organize os numeros em ordem crescente para resolver",
+                    "ESC: Retornar ao menu"
+                ]
+                
+                for i, instruction in enumerate(instructions):
+                    text = self._text(instruction, 20, (180, 180, 180))
+                    background.blit(text, (25, key[0][1] - 80 + i * 22))
+                    
+            self._background = background
+            self._background_key = key
+        return self._background
         
     def _draw_ui(self, surface):
-        board_x, board_y = self._get_board_position()
-        
-        stats_panel = pygame.Rect(20, 20, 280, 140)
-        self._draw_glass_panel(surface, stats_panel)
-        
-        title_font = pygame.font.Font(None, 24)
-        stats_font = pygame.font.Font(None, 28)
-        small_font = pygame.font.Font(None, 20)
+        # Panel, level and instructions come with the cached background
+        moves_text = self._text(f"Movimentos: {self.moves}", 28, self.colors['text_light'])
+        time_text = self._text(f"Tempo: {int(self.elapsed_time)}s", 28, self.colors['text_light'])
         
-        level_text = title_font.render(f"Nivel: {self.current_level}", True, self.colors['text_light'])
-        size_text = title_font.render(f"Grid: {self.grid_size}x{self.grid_size}", True, self.colors['text_light'])
-        moves_text = stats_font.render(f"Movimentos: {self.moves}", True, self.colors['text_light'])
-        time_text = stats_font.render(f"Tempo: {int(self.elapsed_time)}s", True, self.colors['text_light'])
-        
-        surface.blit(level_text, (35, 30))
-        surface.blit(size_text, (35, 55))
         surface.blit(moves_text, (35, 85))
         surface.blit(time_text, (35, 115))
         
-        controls_text = small_font.render("N: Proximo Nivel | H: Mostrar/Ocultar Numeros | R: Reiniciar", True, (150, 200, 150))
+        controls_text = self._text("N: Proximo Nivel | H: Mostrar/Ocultar Numeros | R: Reiniciar", 20, (150, 200, 150))
         surface.blit(controls_text, (35, 150))
         
         if self.game_complete:
-            overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            surface.blit(overlay, (0, 0))
+            size = surface.get_size()
+            sw, sh = size
+            if self._win_overlay is None or self._win_overlay.get_size() != size:
+                overlay = pygame.Surface(size, pygame.SRCALPHA)
+                overlay.fill((0, 0, 0, 180))
+                if pygame.display.get_surface() is not None:
+                    overlay = overlay.convert_alpha()
+                self._win_overlay = overlay
+            surface.blit(self._win_overlay, (0, 0))
             
-            complete_font = pygame.font.Font(None, 48)
-            complete_text = complete_font.render("Puzzle Resolvido!", True, self.colors['complete'])
+            complete_text = self._text("Puzzle Resolvido!", 48, self.colors['complete'])
             surface.blit(complete_text, 
-                        (surface.get_width() // 2 - complete_text.get_width() // 2, 
-                         surface.get_height() // 2 - 60))
+                        (sw // 2 - complete_text.get_width() // 2, 
+                         sh // 2 - 60))
             
-            stats_font = pygame.font.Font(None, 32)
-            stats_text = stats_font.render(f"Resolvido em {self.moves} movimentos, {int(self.elapsed_time)} segundos", True, (200, 200, 200))
+            stats_text = self._text(f"Resolvido em {self.moves} movimentos, {int(self.elapsed_time)} segundos", 32, (200, 200, 200))
             surface.blit(stats_text,
-                        (surface.get_width() // 2 - stats_text.get_width() // 2,
-                         surface.get_height() // 2))
+                        (sw // 2 - stats_text.get_width() // 2,
+                         sh // 2))
             
-            restart_font = pygame.font.Font(None, 24)
-            restart_text = restart_font.render("Pressione R para jogar novamente ou ESC para menu", True, (150, 150, 150))
+            restart_text = self._text("Pressione R para jogar novamente ou ESC para menu", 24, (150, 150, 150))
             surface.blit(restart_text,
-                        (surface.get_width() // 2 - restart_text.get_width() // 2,
-                         surface.get_height() // 2 + 50))
-        else:
-            instruction_font = pygame.font.Font(None, 20)
-            instructions = [
-                "Clique nas pecas para move-las para o espaco vazio",
-                "Organize os numeros em ordem crescente para resolver",
-                "ESC: Retornar ao menu"
-            ]
-            
-            for i, instruction in enumerate(instructions):
-                text = instruction_font.render(instruction, True, (180, 180, 180))
-                surface.blit(text, (25, surface.get_height() - 80 + i * 22))
+                        (sw // 2 - restart_text.get_width() // 2,
+                         sh // 2 + 50))
                 
     def _draw_glass_panel(self, surface, rect):
-        panel_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        panel_surface.fill(self.colors['panel_bg'])
+        key = (rect.width, rect.height)
+        panel_surface = self._glass_cache.get(key)
+        if panel_surface is None:
+            panel_surface = pygame.Surface(key, pygame.SRCALPHA)
+            panel_surface.fill(self.colors['panel_bg'])
+            if pygame.display.get_surface() is not None:
+                panel_surface = panel_surface.convert_alpha()
+            self._glass_cache[key] = panel_surface
         surface.blit(panel_surface, rect)
         pygame.draw.rect(surface, self.colors['panel_border'], rect, 2, border_radius=6)
                 
     def _draw_developer_credit(self, surface):
-        credit_font = pygame.font.Font(None, 16)
         credit_text = "Developed by Gustavo Viana"
-        text_surface = credit_font.render(credit_text, True, (200, 200, 200))
+        text_surface = self._text(credit_text, 16, (200, 200, 200))
         text_surface.set_alpha(150)
+        sw, sh = surface.get_size()
         text_rect = text_surface.get_rect()
-        text_rect.bottomright = (surface.get_width() - 15, surface.get_height() - 15)
+        text_rect.bottomright = (sw - 15, sh - 15)
         surface.blit(text_surface, text_rect)
         
     def _get_board_position(self):
-        board_width = self.grid_size * self.cell_size
-        board_height = self.grid_size * self.cell_size
-        board_x = (self.engine.screen.get_width() - board_width) // 2
-        board_y = (self.engine.screen.get_height() - board_height) // 2
-        return board_x, board_y
+        # Recomputed only when the window or the grid size changes
+        screen_size = self.engine.screen.get_size()
+        if screen_size != self._last_screen_size:
+            board_width = self.grid_size * self.cell_size
+            board_height = self.grid_size * self.cell_size
+            board_x = (screen_size[0] - board_width) // 2
+            board_y = (screen_size[1] - board_height) // 2
+            self._board_pos = (board_x, board_y)
+            self._last_screen_size = screen_size
+        return self._board_pos
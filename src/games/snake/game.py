@@ -1,11 +1,24 @@
 import pygame
 import random
-from typing import List, Tuple, Optional
+from collections import deque
+from itertools import islice
+from typing import List, Tuple, Optional, Dict, Deque
 from ..base_game import BaseGame
 
 class SnakeGame(BaseGame):
     """Professional Snake game implementation"""
     
+    # Segments past this index share one color, so only the first ones recolor as the snake moves
+    GRADIENT_SEGMENTS = 25
+    
+    # Movement controls - Arrow keys, WASD, and Numpad
+    KEY_DIRECTIONS = {
+        pygame.K_UP: (0, -1), pygame.K_w: (0, -1), pygame.K_KP8: (0, -1),
+        pygame.K_DOWN: (0, 1), pygame.K_s: (0, 1), pygame.K_KP2: (0, 1),
+        pygame.K_LEFT: (-1, 0), pygame.K_a: (-1, 0), pygame.K_KP4: (-1, 0),
+        pygame.K_RIGHT: (1, 0), pygame.K_d: (1, 0), pygame.K_KP6: (1, 0),
+    }
+    
     def __init__(self, engine):
         super().__init__(engine, "snake")
         self.grid_sizes = {
@@ -23,16 +36,40 @@ class SnakeGame(BaseGame):
         self.grid_size = self.grid_sizes[self.current_grid_size]
         self.speed = self.speeds[self.current_speed]
         self.cell_size = 30
-        self.snake: List[Tuple[int, int]] = []
+        # Cells are encoded as y * grid_size + x; see _pack/_unpack
+        self.snake: Deque[int] = deque()  # Head first
+        self._occ = 0  # Occupancy bitset: bit c is set while the snake covers cell c
+        self.free_cells: List[int] = []  # Cells not occupied by the snake, in no particular order
+        self.free_index: Dict[int, int] = {}  # Position of each free cell in free_cells
         self.direction = (1, 0)  # Start moving right
         self.next_direction = (1, 0)
-        self.food: Optional[Tuple[int, int]] = None
+        self.food: Optional[int] = None
         self.game_over = False
         self.score = 0
         self.move_timer = 0.0
+        self._move_interval = 1.0 / self.speed
         self.in_menu = False
         self.size_buttons = {}
         self.speed_buttons = {}
+        self._all_buttons: List[Tuple[str, str, pygame.Rect]] = []
+        self._button_labels: Dict[Tuple[str, str], Tuple[pygame.Surface, pygame.Rect]] = {}
+        self._board_bg: Optional[pygame.Surface] = None  # Screen-sized fill with the grid lines drawn in
+        self._cell_origin: List[Tuple[int, int]] = []  # Screen top-left of each cell, rebuilt with _board_bg
+        self._cell_rects: List[pygame.Rect] = []  # Screen rect of each cell, rebuilt with _board_bg
+        # Scratch rects moved in place while drawing instead of allocating new ones
+        self._segment_rect = pygame.Rect(0, 0, 0, 0)
+        self._food_rect = pygame.Rect(0, 0, 0, 0)
+        self._stem_rect = pygame.Rect(0, 0, 4, 8)
+        self._head_surface: Optional[pygame.Surface] = None  # Cell-sized head with its eyes, built with _board_bg
+        self._fonts = {size: pygame.font.Font(None, size) for size in (18, 20, 22, 24, 28, 32, 36, 48, 64)}
+        self._text_cache: Dict[object, Tuple[str, pygame.Surface]] = {}
+        self._overlays: Dict[Tuple[Tuple[int, int], int], pygame.Surface] = {}
+        self._snake_colors: List[Tuple[int, int, int]] = []  # Segment color by index, grown with the snake
+        self._board_buffer: Optional[pygame.Surface] = None  # Background plus snake and food, patched per cell
+        self._buffer_stale = True  # Whole buffer must be redrawn (new game, resize)
+        self._dirty_cells = set()  # Cells whose contents changed since the buffer was last patched
+        self._last_frame_key = None
+        self._last_score_rect: Optional[pygame.Rect] = None
         
         self.initialize()
         
@@ -40,6 +77,7 @@ class SnakeGame(BaseGame):
         """Initialize snake game state"""
         self.grid_size = self.grid_sizes[self.current_grid_size]
         self.speed = self.speeds[self.current_speed]
+        self._move_interval = 1.0 / self.speed
         
         # Adjust cell size based on grid size to fit screen
         max_grid_size = max(self.grid_sizes.values())
@@ -48,7 +86,16 @@ class SnakeGame(BaseGame):
         # Start snake in the middle
         start_x = self.grid_size // 2
         start_y = self.grid_size // 2
-        self.snake = [(start_x, start_y), (start_x - 1, start_y), (start_x - 2, start_y)]
+        self.snake = deque([self._pack(start_x, start_y), self._pack(start_x - 1, start_y),
+                            self._pack(start_x - 2, start_y)])
+        self._occ = 0
+        for cell in self.snake:
+            self._occ |= 1 << cell
+        self.free_cells = [
+            self._pack(x, y) for x in range(self.grid_size) for y in range(self.grid_size)
+            if not self._occ >> self._pack(x, y) & 1
+        ]
+        self.free_index = {cell: i for i, cell in enumerate(self.free_cells)}
         
         self.direction = (1, 0)
         self.next_direction = (1, 0)
@@ -56,11 +103,13 @@ class SnakeGame(BaseGame):
         self.score = 0
         self.move_timer = 0.0
         self.in_menu = False
-        self._create_menu_buttons()
+        self._rebuild_cached_surfaces()
         self._spawn_food()
+        self._buffer_stale = True
+        self._dirty_cells.clear()
         
-    def _create_menu_buttons(self):
-        """Create menu selection buttons"""
+    def _rebuild_cached_surfaces(self):
+        """Create menu selection buttons and the pre-drawn board background"""
         screen_width = self.engine.screen.get_width()
         screen_height = self.engine.screen.get_height()
         
@@ -82,33 +131,149 @@ class SnakeGame(BaseGame):
             "fast": pygame.Rect(start_x + (button_width + 20) * 2, 280, button_width, button_height)
         }
         
+        # Flat (setting, option, rect) list so a click is hit-tested in one pass
+        self._all_buttons = (
+            [("grid_size", name, rect) for name, rect in self.size_buttons.items()] +
+            [("speed", name, rect) for name, rect in self.speed_buttons.items()]
+        )
+        
+        # Button labels never change; render each once, centered on its button
+        button_font = self._fonts[22]  # Smaller font to fit
+        self._button_labels = {}
+        for setting, name, rect in self._all_buttons:
+            label = button_font.render(name.title(), True, (255, 255, 255))
+            self._button_labels[(setting, name)] = (label, label.get_rect(center=rect.center))
+        
+        self._build_board_background(self.engine.screen.get_size())
+        
+    def _build_board_background(self, size: Tuple[int, int]):
+        """Draw the background fill and grid lines once into a screen-sized surface"""
+        self._board_bg = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            self._board_bg = self._board_bg.convert()
+        self._board_bg.fill((15, 15, 30))
+        
+        # Pixel coordinate of every grid line; cells start on them, so draw code never multiplies
+        board_x, board_y = self._get_board_position()
+        line_xs = [board_x + i * self.cell_size for i in range(self.grid_size + 1)]
+        line_ys = [board_y + i * self.cell_size for i in range(self.grid_size + 1)]
+        self._cell_origin = [(line_xs[x], line_ys[y]) for y in range(self.grid_size) for x in range(self.grid_size)]
+        self._cell_rects = [pygame.Rect(origin, (self.cell_size, self.cell_size)) for origin in self._cell_origin]
+        self._segment_rect.size = (self.cell_size - 2, self.cell_size - 2)
+        self._food_rect.size = (self.cell_size - 8, self.cell_size - 8)
+        self._head_surface = self._build_head_surface()
+        
+        grid_color = (40, 40, 60)
+        for line_x, line_y in zip(line_xs, line_ys):
+            pygame.draw.line(self._board_bg, grid_color, (line_x, line_ys[0]), (line_x, line_ys[-1]), 1)
+            pygame.draw.line(self._board_bg, grid_color, (line_xs[0], line_y), (line_xs[-1], line_y), 1)
+        
+    def _build_head_surface(self) -> pygame.Surface:
+        """Draw the head segment and its eyes once into a cell-sized surface"""
+        cell_size = self.cell_size
+        head = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+        pygame.draw.rect(head, self._segment_colors()[0], (1, 1, cell_size - 2, cell_size - 2), border_radius=4)
+        
+        eye_size = max(2, cell_size // 10)
+        eye_y = cell_size // 3
+        pygame.draw.circle(head, (0, 0, 0), (cell_size // 3, eye_y), eye_size)
+        pygame.draw.circle(head, (0, 0, 0), (2 * cell_size // 3, eye_y), eye_size)
+        
+        if pygame.display.get_surface() is not None:
+            head = head.convert_alpha()
+        return head
+        
     def update(self, delta_time: float):
         """Update snake game logic"""
         if self.in_menu or self.game_over:
             return
             
         self.move_timer += delta_time
-        move_interval = 1.0 / self.speed
         
-        if self.move_timer >= move_interval:
+        # Catch up on every step that fell due, so a slow frame doesn't slow the snake
+        while self.move_timer >= self._move_interval and not self.game_over:
             self.direction = self.next_direction
             self._move_snake()
-            self.move_timer = 0.0
+            self.move_timer -= self._move_interval
             
-    def render(self, surface: pygame.Surface):
-        """Render snake game"""
-        self._draw_background(surface)
+    def render(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """
+        Render snake game
         
+        Args:
+            surface: Pygame surface to render onto
+            
+        Returns:
+            Screen rects that changed this frame, or None when the whole screen changed
+        """
         if self.in_menu:
+            self._draw_background(surface)
             self._draw_settings_menu(surface)
-        else:
-            self._draw_grid(surface)
-            self._draw_snake(surface)
-            self._draw_food(surface)
-            self._draw_ui(surface)
+            self._draw_developer_credit(surface)
+            self._last_frame_key = None
+            return None
             
+        size = surface.get_size()
+        cell_rects = self._update_board_buffer(size)
+        surface.blit(self._board_buffer, (0, 0))
+        self._draw_ui(surface)
         self._draw_developer_credit(surface)
         
+        frame_key = (size, self.game_over, self.current_grid_size, self.current_speed)
+        score_rect = self._text_cache["score"][1].get_rect(topleft=(20, 20))
+        if cell_rects is None or frame_key != self._last_frame_key:
+            dirty = None
+        else:
+            dirty = cell_rects
+            if score_rect != self._last_score_rect:
+                dirty.append(score_rect.union(self._last_score_rect))
+        self._last_frame_key = frame_key
+        self._last_score_rect = score_rect
+        return dirty
+        
+    def _update_board_buffer(self, size: Tuple[int, int]) -> Optional[List[pygame.Rect]]:
+        """
+        Bring the off-screen board up to date with the snake and food
+        
+        Args:
+            size: Screen size the buffer must match
+            
+        Returns:
+            Screen rects of the cells that were repainted, or None if the buffer was rebuilt
+        """
+        if self._buffer_stale or self._board_buffer is None or self._board_buffer.get_size() != size:
+            if self._board_bg.get_size() != size:
+                self._build_board_background(size)
+            self._board_buffer = self._board_bg.copy()
+            self._draw_snake(self._board_buffer)
+            self._draw_food(self._board_buffer)
+            self._buffer_stale = False
+            self._dirty_cells.clear()
+            return None
+            
+        buffer = self._board_buffer
+        cell_rects = self._cell_rects
+        colors = self._segment_colors()
+        head_indices = {cell: i for i, cell in enumerate(islice(self.snake, self.GRADIENT_SEGMENTS))}
+        
+        rects = []
+        for cell in self._dirty_cells:
+            rect = cell_rects[cell]
+            buffer.blit(self._board_bg, rect, rect)
+            
+            if self._occ >> cell & 1:
+                index = head_indices.get(cell, self.GRADIENT_SEGMENTS - 1)
+                if index == 0:
+                    buffer.blit(self._head_surface, rect)
+                else:
+                    self._draw_segment(buffer, cell, colors[index])
+            elif cell == self.food:
+                self._draw_food(buffer)
+            rects.append(rect)
+            
+        self._dirty_cells.clear()
+        return rects
+                
     def handle_event(self, event: pygame.event.Event):
         """Handle snake game events"""
         if event.type == pygame.KEYDOWN:
@@ -125,15 +290,11 @@ class SnakeGame(BaseGame):
                 elif event.key == pygame.K_ESCAPE:
                     self.engine._return_to_menu()
             else:
-                # Movement controls - Arrow keys, WASD, and Numpad
-                if event.key in [pygame.K_UP, pygame.K_w, pygame.K_KP8] and self.direction != (0, 1):
-                    self.next_direction = (0, -1)
-                elif event.key in [pygame.K_DOWN, pygame.K_s, pygame.K_KP2] and self.direction != (0, -1):
-                    self.next_direction = (0, 1)
-                elif event.key in [pygame.K_LEFT, pygame.K_a, pygame.K_KP4] and self.direction != (1, 0):
-                    self.next_direction = (-1, 0)
-                elif event.key in [pygame.K_RIGHT, pygame.K_d, pygame.K_KP6] and self.direction != (-1, 0):
-                    self.next_direction = (1, 0)
+                new_direction = self.KEY_DIRECTIONS.get(event.key)
+                if new_direction is not None:
+                    # Reversing straight into the body is ignored
+                    if (new_direction[0] + self.direction[0], new_direction[1] + self.direction[1]) != (0, 0):
+                        self.next_direction = new_direction
                 elif event.key == pygame.K_m:
                     self.in_menu = True
                     
@@ -143,38 +304,42 @@ class SnakeGame(BaseGame):
                 
     def _handle_menu_selection(self, mouse_pos):
         """Handle menu selections"""
-        # Check grid size buttons
-        for size_name, button_rect in self.size_buttons.items():
-            if button_rect.collidepoint(mouse_pos):
-                self.current_grid_size = size_name
-                self.initialize()
-                break
-                
-        # Check speed buttons
-        for speed_name, button_rect in self.speed_buttons.items():
-            if button_rect.collidepoint(mouse_pos):
-                self.current_speed = speed_name
-                self.initialize()
-                break
+        hit = next((button for button in self._all_buttons if button[2].collidepoint(mouse_pos)), None)
+        if hit is None:
+            return
+            
+        setting, name, _ = hit
+        if setting == "grid_size":
+            self.current_grid_size = name
+        else:
+            self.current_speed = name
+        self.initialize()
                 
     def _move_snake(self):
         """Move the snake forward"""
-        head_x, head_y = self.snake[0]
-        new_head = (head_x + self.direction[0], head_y + self.direction[1])
+        grid_size = self.grid_size
+        head_y, head_x = divmod(self.snake[0], grid_size)
+        new_x = head_x + self.direction[0]
+        new_y = head_y + self.direction[1]
         
         # Check collision with walls
-        if (new_head[0] < 0 or new_head[0] >= self.grid_size or 
-            new_head[1] < 0 or new_head[1] >= self.grid_size):
+        if new_x < 0 or new_x >= grid_size or new_y < 0 or new_y >= grid_size:
             self.game_over = True
             return
             
-        # Check collision with self
-        if new_head in self.snake:
+        new_head = new_y * grid_size + new_x
+        
+        # Check collision with self (the tail still counts, it only moves after this check)
+        if self._occ >> new_head & 1:
             self.game_over = True
             return
             
-        # Move snake
-        self.snake.insert(0, new_head)
+        # Move snake; segments near the head change color as they shift back
+        self._dirty_cells.update(islice(self.snake, self.GRADIENT_SEGMENTS))
+        self._dirty_cells.add(new_head)
+        self.snake.appendleft(new_head)
+        self._occ |= 1 << new_head
+        self._occupy_cell(new_head)
         
         # Check if food eaten
         if new_head == self.food:
@@ -182,134 +347,132 @@ class SnakeGame(BaseGame):
             self._spawn_food()
         else:
             # Remove tail if no food eaten
-            self.snake.pop()
+            tail = self.snake.pop()
+            self._occ ^= 1 << tail
+            self._dirty_cells.add(tail)
+            self._release_cell(tail)
+            
+    def _pack(self, x: int, y: int) -> int:
+        """Encode a grid position as a single cell index"""
+        return y * self.grid_size + x
+        
+    def _unpack(self, cell: int) -> Tuple[int, int]:
+        """Decode a cell index back into (x, y)"""
+        y, x = divmod(cell, self.grid_size)
+        return x, y
+        
+    def _occupy_cell(self, cell: int):
+        """Remove a cell from the free list by swapping it with the last entry"""
+        index = self.free_index.pop(cell)
+        last = self.free_cells.pop()
+        if last != cell:
+            self.free_cells[index] = last
+            self.free_index[last] = index
+            
+    def _release_cell(self, cell: int):
+        """Return a cell to the free list"""
+        self.free_index[cell] = len(self.free_cells)
+        self.free_cells.append(cell)
             
     def _spawn_food(self):
-        """Spawn food at random position"""
-        while True:
-            food_pos = (random.randint(0, self.grid_size - 1), 
-                       random.randint(0, self.grid_size - 1))
-            if food_pos not in self.snake:
-                self.food = food_pos
-                break
+        """Spawn food on a uniformly chosen free cell"""
+        if not self.free_cells:
+            # The snake fills the whole board
+            self.food = None
+            return
+        self.food = self.free_cells[random.randrange(len(self.free_cells))]
+        self._dirty_cells.add(self.food)
                 
     def _draw_background(self, surface: pygame.Surface):
         """Draw game background"""
         surface.fill((15, 15, 30))
         
-    def _draw_grid(self, surface: pygame.Surface):
-        """Draw grid lines"""
-        grid_color = (40, 40, 60)
-        board_x, board_y = self._get_board_position()
+    def _segment_colors(self) -> List[Tuple[int, int, int]]:
+        """Return segment colors by index, covering at least the current snake"""
+        # Gradient color from head to tail only depends on the segment index
+        colors = self._snake_colors
+        while len(colors) < max(len(self.snake), self.GRADIENT_SEGMENTS):
+            i = len(colors)
+            color_value = max(80, 200 - i * 5)
+            colors.append((100, color_value, 100) if i == 0 else (80, color_value - 20, 80))
+        return colors
         
-        # Draw vertical lines
-        for x in range(self.grid_size + 1):
-            pygame.draw.line(
-                surface, grid_color,
-                (board_x + x * self.cell_size, board_y),
-                (board_x + x * self.cell_size, board_y + self.grid_size * self.cell_size),
-                1
-            )
-            
-        # Draw horizontal lines
-        for y in range(self.grid_size + 1):
-            pygame.draw.line(
-                surface, grid_color,
-                (board_x, board_y + y * self.cell_size),
-                (board_x + self.grid_size * self.cell_size, board_y + y * self.cell_size),
-                1
-            )
-            
     def _draw_snake(self, surface: pygame.Surface):
         """Draw the snake"""
-        board_x, board_y = self._get_board_position()
-        
-        # Draw snake body
-        for i, (x, y) in enumerate(self.snake):
-            # Gradient color from head to tail
-            color_value = max(80, 200 - i * 5)
-            color = (100, color_value, 100) if i == 0 else (80, color_value - 20, 80)
-            
-            rect = pygame.Rect(
-                board_x + x * self.cell_size + 1,
-                board_y + y * self.cell_size + 1,
-                self.cell_size - 2,
-                self.cell_size - 2
-            )
-            pygame.draw.rect(surface, color, rect, border_radius=4)
+        colors = self._segment_colors()
+        
+        # Draw snake body; square segments take SDL's fill fast path
+        cell_origin = self._cell_origin
+        rect = self._segment_rect
+        fill = surface.fill
+        for color, cell in islice(zip(colors, self.snake), 1, None):
+            x, y = cell_origin[cell]
+            rect.x = x + 1
+            rect.y = y + 1
+            fill(color, rect)
             
-            # Draw eyes on head
-            if i == 0:
-                eye_size = max(2, self.cell_size // 10)
-                # Left eye
-                left_eye_x = board_x + x * self.cell_size + self.cell_size // 3
-                right_eye_x = board_x + x * self.cell_size + 2 * self.cell_size // 3
-                eye_y = board_y + y * self.cell_size + self.cell_size // 3
-                
-                pygame.draw.circle(surface, (0, 0, 0), (left_eye_x, eye_y), eye_size)
-                pygame.draw.circle(surface, (0, 0, 0), (right_eye_x, eye_y), eye_size)
-                
+        # Head and eyes come pre-drawn
+        surface.blit(self._head_surface, cell_origin[self.snake[0]])
+        
+    def _draw_segment(self, surface: pygame.Surface, cell: int, color: Tuple[int, int, int]):
+        """Draw a single body segment"""
+        x, y = self._cell_origin[cell]
+        rect = self._segment_rect
+        rect.x = x + 1
+        rect.y = y + 1
+        surface.fill(color, rect)
+        
     def _draw_food(self, surface: pygame.Surface):
         """Draw the food"""
-        if not self.food:
+        if self.food is None:
             return
             
-        board_x, board_y = self._get_board_position()
-        x, y = self.food
+        x, y = self._cell_origin[self.food]
         
         # Draw apple-like food
-        food_rect = pygame.Rect(
-            board_x + x * self.cell_size + 4,
-            board_y + y * self.cell_size + 4,
-            self.cell_size - 8,
-            self.cell_size - 8
-        )
+        food_rect = self._food_rect
+        food_rect.x = x + 4
+        food_rect.y = y + 4
         
         # Red apple with green stem
         pygame.draw.circle(surface, (255, 50, 50), food_rect.center, food_rect.width // 2 - 2)
         
         # Green stem
-        stem_rect = pygame.Rect(
-            food_rect.centerx - 2,
-            food_rect.top - 4,
-            4, 8
-        )
+        stem_rect = self._stem_rect
+        stem_rect.x = food_rect.centerx - 2
+        stem_rect.y = food_rect.top - 4
         pygame.draw.rect(surface, (50, 180, 50), stem_rect, border_radius=2)
         
     def _draw_ui(self, surface: pygame.Surface):
         """Draw game UI"""
+        sw, sh = surface.get_size()
+        cx = sw // 2
+        
         # Score display
-        score_font = pygame.font.Font(None, 36)
-        score_text = score_font.render(f"Score: {self.score}", True, (255, 255, 255))
+        score_text = self._render_cached("score", 36, f"Score: {self.score}", (255, 255, 255))
         surface.blit(score_text, (20, 20))
         
         # Settings display
-        settings_font = pygame.font.Font(None, 28)
-        size_text = settings_font.render(f"Grid: {self.current_grid_size.title()}", True, (100, 200, 255))
-        speed_text = settings_font.render(f"Speed: {self.current_speed.title()}", True, (200, 200, 100))
+        size_text = self._render_cached("grid", 28, f"Grid: {self.current_grid_size.title()}", (100, 200, 255))
+        speed_text = self._render_cached("speed", 28, f"Speed: {self.current_speed.title()}", (200, 200, 100))
         
         surface.blit(size_text, (20, 65))
         surface.blit(speed_text, (20, 95))
         
         # Game over message
         if self.game_over:
-            overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            surface.blit(overlay, (0, 0))
+            surface.blit(self._get_overlay((sw, sh), 150), (0, 0))
             
-            game_over_font = pygame.font.Font(None, 64)
-            game_over_text = game_over_font.render("GAME OVER", True, (255, 50, 50))
+            game_over_text = self._render_cached("game_over", 64, "GAME OVER", (255, 50, 50))
             surface.blit(game_over_text, 
-                        (surface.get_width() // 2 - game_over_text.get_width() // 2, 
-                         surface.get_height() // 2 - 80))
+                        (cx - game_over_text.get_width() // 2, 
+                         sh // 2 - 80))
             
-            score_font = pygame.font.Font(None, 36)
-            final_score_text = score_font.render(f"Final Score: {self.score}", True, (255, 255, 255))
+            final_score_text = self._render_cached("final_score", 36, f"Final Score: {self.score}", (255, 255, 255))
             surface.blit(final_score_text,
-                        (surface.get_width() // 2 - final_score_text.get_width() // 2,
-                         surface.get_height() // 2 - 20))
+                        (cx - final_score_text.get_width() // 2,
+                         sh // 2 - 20))
             
-            restart_font = pygame.font.Font(None, 24)
             instructions = [
                 "R: Restart game",
                 "M: Change settings", 
@@ -317,13 +480,12 @@ class SnakeGame(BaseGame):
             ]
             
             for i, instruction in enumerate(instructions):
-                text = restart_font.render(instruction, True, (200, 200, 200))
+                text = self._render_cached(("restart", i), 24, instruction, (200, 200, 200))
                 surface.blit(text,
-                            (surface.get_width() // 2 - text.get_width() // 2,
-                             surface.get_height() // 2 + 30 + i * 25))
+                            (cx - text.get_width() // 2,
+                             sh // 2 + 30 + i * 25))
         else:
             # Instructions
-            instruction_font = pygame.font.Font(None, 20)
             controls = [
                 "CONTROLS:",
                 "Movement: ARROWS, WASD, or NUMPAD (2,4,6,8)",
@@ -333,25 +495,24 @@ class SnakeGame(BaseGame):
             
             for i, control in enumerate(controls):
                 color = (150, 200, 255) if i == 0 else (150, 150, 150)
-                text = instruction_font.render(control, True, color)
-                surface.blit(text, (20, surface.get_height() - 100 + i * 22))
+                text = self._render_cached(("controls", i), 20, control, color)
+                surface.blit(text, (20, sh - 100 + i * 22))
                 
     def _draw_settings_menu(self, surface: pygame.Surface):
         """Draw settings menu"""
+        sw, sh = surface.get_size()
+        cx = sw // 2
+        
         # Semi-transparent overlay
-        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self._get_overlay((sw, sh), 200), (0, 0))
         
         # Title
-        title_font = pygame.font.Font(None, 48)
-        title_text = title_font.render("Game Settings", True, (255, 255, 255))
-        surface.blit(title_text, (surface.get_width() // 2 - title_text.get_width() // 2, 100))
+        title_text = self._render_cached("settings_title", 48, "Game Settings", (255, 255, 255))
+        surface.blit(title_text, (cx - title_text.get_width() // 2, 100))
         
         # Grid Size Section
-        size_font = pygame.font.Font(None, 32)
-        size_title = size_font.render("Grid Size", True, (100, 200, 255))
-        surface.blit(size_title, (surface.get_width() // 2 - size_title.get_width() // 2, 160))
+        size_title = self._render_cached("size_title", 32, "Grid Size", (100, 200, 255))
+        surface.blit(size_title, (cx - size_title.get_width() // 2, 160))
         
         # Draw grid size buttons
         for size_name, button_rect in self.size_buttons.items():
@@ -362,16 +523,11 @@ class SnakeGame(BaseGame):
             pygame.draw.rect(surface, color, button_rect, border_radius=8)
             pygame.draw.rect(surface, border_color, button_rect, 2, border_radius=8)
             
-            # Button text - properly fitted
-            button_font = pygame.font.Font(None, 22)  # Smaller font to fit
-            size_display = size_name.title()
-            text_surface = button_font.render(size_display, True, (255, 255, 255))
-            text_rect = text_surface.get_rect(center=button_rect.center)
-            surface.blit(text_surface, text_rect)
+            surface.blit(*self._button_labels[("grid_size", size_name)])
             
         # Speed Section
-        speed_title = size_font.render("Game Speed", True, (200, 200, 100))
-        surface.blit(speed_title, (surface.get_width() // 2 - speed_title.get_width() // 2, 240))
+        speed_title = self._render_cached("speed_title", 32, "Game Speed", (200, 200, 100))
+        surface.blit(speed_title, (cx - speed_title.get_width() // 2, 240))
         
         # Draw speed buttons
         for speed_name, button_rect in self.speed_buttons.items():
@@ -382,15 +538,9 @@ class SnakeGame(BaseGame):
             pygame.draw.rect(surface, color, button_rect, border_radius=8)
             pygame.draw.rect(surface, border_color, button_rect, 2, border_radius=8)
             
-            # Button text - properly fitted
-            button_font = pygame.font.Font(None, 22)
-            speed_display = speed_name.title()
-            text_surface = button_font.render(speed_display, True, (255, 255, 255))
-            text_rect = text_surface.get_rect(center=button_rect.center)
-            surface.blit(text_surface, text_rect)
+            surface.blit(*self._button_labels[("speed", speed_name)])
             
         # Instructions
-        instruction_font = pygame.font.Font(None, 24)
         instructions = [
             "Click settings to change",
             "ENTER: Start game",
@@ -398,24 +548,54 @@ class SnakeGame(BaseGame):
         ]
         
         for i, instruction in enumerate(instructions):
-            text = instruction_font.render(instruction, True, (200, 200, 200))
+            text = self._render_cached(("settings_help", i), 24, instruction, (200, 200, 200))
             surface.blit(text, 
-                        (surface.get_width() // 2 - text.get_width() // 2,
-                         surface.get_height() - 150 + i * 30))
+                        (cx - text.get_width() // 2,
+                         sh - 150 + i * 30))
                 
     def _draw_developer_credit(self, surface: pygame.Surface):
         """Render professional developer credit"""
-        credit_font = pygame.font.Font(None, 18)
-        credit_text = "Developed by Gustavo Viana"
+        sw, sh = surface.get_size()
         
-        text_surface = credit_font.render(credit_text, True, (200, 200, 200))
+        text_surface = self._render_cached("credit", 18, "Developed by Gustavo Viana", (200, 200, 200))
         text_surface.set_alpha(128)
         
         text_rect = text_surface.get_rect()
-        text_rect.bottomright = (surface.get_width() - 20, surface.get_height() - 20)
+        text_rect.bottomright = (sw - 20, sh - 20)
         
         surface.blit(text_surface, text_rect)
         
+    def _get_overlay(self, size: Tuple[int, int], alpha: int) -> pygame.Surface:
+        """Return a cached full-screen black overlay with the given alpha"""
+        key = (size, alpha)
+        overlay = self._overlays.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(size, pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, alpha))
+            if pygame.display.get_surface() is not None:
+                overlay = overlay.convert_alpha()
+            self._overlays[key] = overlay
+        return overlay
+        
+    def _render_cached(self, key, font_size: int, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render text once per key and reuse it until the text changes
+        
+        Args:
+            key: Slot the text is drawn into, e.g. "score"
+            font_size: Size of the cached font to render with
+            text: Text to draw
+            color: Text color; fixed per key
+            
+        Returns:
+            Rendered text surface
+        """
+        entry = self._text_cache.get(key)
+        if entry is None or entry[0] != text:
+            entry = (text, self._fonts[font_size].render(text, True, color))
+            self._text_cache[key] = entry
+        return entry[1]
+        
     def _get_board_position(self) -> Tuple[int, int]:
         """Calculate board position to center it on screen"""
         board_width = self.grid_size * self.cell_size
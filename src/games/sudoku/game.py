@@ -1,8 +1,9 @@
 import pygame
-import random
 import time
+import numpy as np
 from typing import List, Tuple, Optional, Dict
 from ..base_game import BaseGame
+from utils.helpers import get_font
 
 class SudokuGame(BaseGame):
     def __init__(self, engine):
@@ -19,6 +20,11 @@ class SudokuGame(BaseGame):
         self.board = []
         self.solution = []
         self.user_board = []
+        self.cells_remaining = 0
+        # Bit (n - 1) set when digit n is already placed in that row/column/box
+        self.row_mask = [0] * 9
+        self.col_mask = [0] * 9
+        self.box_mask = [0] * 9
         self.selected_cell = None
         self.mistakes = 0
         self.max_mistakes = 3
@@ -44,105 +50,180 @@ class SudokuGame(BaseGame):
             'complete': (100, 255, 100)
         }
         
+        # Digit keys on both the main row and the keypad
+        self._num_keys = {
+            pygame.K_1: 1, pygame.K_KP1: 1,
+            pygame.K_2: 2, pygame.K_KP2: 2,
+            pygame.K_3: 3, pygame.K_KP3: 3,
+            pygame.K_4: 4, pygame.K_KP4: 4,
+            pygame.K_5: 5, pygame.K_KP5: 5,
+            pygame.K_6: 6, pygame.K_KP6: 6,
+            pygame.K_7: 7, pygame.K_KP7: 7,
+            pygame.K_8: 8, pygame.K_KP8: 8,
+            pygame.K_9: 9, pygame.K_KP9: 9
+        }
+        self._cmd_keys = {
+            pygame.K_r: self.initialize,
+            pygame.K_n: self._switch_level,
+            pygame.K_ESCAPE: self.engine._return_to_menu
+        }
+        
+        # Fonts come from the shared cache instead of being built per frame
+        self._font_num = get_font(36)
+        self._font_title = get_font(24)
+        self._font_stats = get_font(28)
+        self._font_small = get_font(20)
+        self._font_complete = get_font(48)
+        self._font_result = get_font(32)
+        self._font_credit = get_font(16)
+        
+        # Rendered UI text by slot, re-rendered only when the string changes
+        self._ui_cache = {}
+        
+        # Board placement and cell rects for the current screen size
+        self._board_pos = None
+        self._board_pos_screen = None
+        self._cell_rects = []
+        
+        # The grid does not depend on where the board is placed, so it is built once
+        self._grid_surf = self._build_grid_surface()
+        
+        # End-of-game dimming overlay for the current screen size
+        self._gameover_overlay = None
+        self._gameover_overlay_size = None
+        
+        # Glass panel fills by (width, height)
+        self._panel_cache = {}
+        
+        # Last rendered frame, reused until something visible changes
+        self._cached_surface = None
+        self._dirty = True
+        self._frame_seconds = -1
+        
+        # Digits 1-9 pre-rendered per cell color, indexed by value
+        self._digit_surfs = {
+            color: [None] + [self._font_num.render(str(d), True, color) for d in range(1, 10)]
+            for color in (self.colors['text_light'], self.colors['text_user'], self.colors['text_error'])
+        }
+        
         self.initialize()
 
     def _generate_solution(self):
         base = 3
         side = base * base
-        def pattern(r, c): return (base * (r % base) + r // base + c) % side
-        def shuffle(s): return random.sample(s, len(s))
+        r = np.arange(side)
+        pattern = (base * (r[:, None] % base) + r[:, None] // base + r) % side
         
-        rBase = range(base)
-        rows = [g * base + r for g in shuffle(rBase) for r in shuffle(rBase)]
-        cols = [g * base + c for g in shuffle(rBase) for c in shuffle(rBase)]
-        nums = shuffle(range(1, base * base + 1))
+        # Shuffle the bands/stacks and, independently, the lines inside each one
+        def shuffle_lines():
+            bands = np.random.permutation(base)[:, None] * base
+            inner = np.argsort(np.random.random((base, base)), axis=1)
+            return (bands + inner).ravel()
         
-        board = [[nums[pattern(r, c)] for c in cols] for r in rows]
-        return board
+        rows = shuffle_lines()
+        cols = shuffle_lines()
+        nums = np.random.permutation(side).astype(np.uint8) + 1
+        
+        board = nums[pattern[np.ix_(rows, cols)]]
+        # Cells are read one at a time elsewhere, where nested lists are faster
+        return board.tolist()
 
     def _remove_numbers(self, board, cells_to_remove):
-        puzzle = [row[:] for row in board]
-        cells = [(i, j) for i in range(9) for j in range(9)]
-        random.shuffle(cells)
-        
-        for i, j in cells[:cells_to_remove]:
-            puzzle[i][j] = 0
-        return puzzle
+        puzzle = np.array(board, dtype=np.uint8)
+        puzzle.flat[np.random.choice(81, cells_to_remove, replace=False)] = 0
+        return puzzle.tolist()
 
-    def _is_valid(self, board, row, col, num):
-        for x in range(9):
-            if board[row][x] == num or board[x][col] == num:
-                return False
-        
-        start_row, start_col = 3 * (row // 3), 3 * (col // 3)
-        for i in range(3):
-            for j in range(3):
-                if board[i + start_row][j + start_col] == num:
-                    return False
-        return True
+    def _build_masks(self, board):
+        self.row_mask = [0] * 9
+        self.col_mask = [0] * 9
+        self.box_mask = [0] * 9
+        for r in range(9):
+            for c in range(9):
+                v = board[r][c]
+                if v:
+                    bit = 1 << (v - 1)
+                    self.row_mask[r] |= bit
+                    self.col_mask[c] |= bit
+                    self.box_mask[(r // 3) * 3 + c // 3] |= bit
+
+    def _toggle_mask(self, row, col, num):
+        # XOR so the same call sets the bit on placement and clears it on removal
+        bit = 1 << (num - 1)
+        self.row_mask[row] ^= bit
+        self.col_mask[col] ^= bit
+        self.box_mask[(row // 3) * 3 + col // 3] ^= bit
+
+    def _is_valid(self, row, col, num):
+        bit = 1 << (num - 1)
+        used = self.row_mask[row] | self.col_mask[col] | self.box_mask[(row // 3) * 3 + col // 3]
+        return not used & bit
 
     def initialize(self):
         self.solution = self._generate_solution()
         self.board = self._remove_numbers(self.solution, self.cells_to_remove)
         self.user_board = [row[:] for row in self.board]
+        self._build_masks(self.user_board)
+        self.cells_remaining = self.cells_to_remove
         self.selected_cell = None
         self.mistakes = 0
         self.game_complete = False
         self.start_time = time.time()
         self.elapsed_time = 0
         self.hints_used = 0
+        self._dirty = True
 
     def update(self, delta_time):
         if not self.game_complete:
             self.elapsed_time = time.time() - self.start_time
             
-        if not self.game_complete and self.user_board == self.solution:
+        if not self.game_complete and self.cells_remaining == 0:
             self.game_complete = True
+            self._dirty = True
 
     def render(self, surface):
-        surface.fill(self.colors['background'])
-        self._draw_grid(surface)
-        self._draw_numbers(surface)
-        self._draw_ui(surface)
-        self._draw_developer_credit(surface)
+        # The timer label is the only thing that changes without an event
+        seconds = int(self.elapsed_time)
+        if seconds != self._frame_seconds:
+            self._frame_seconds = seconds
+            self._dirty = True
+        
+        frame = self._cached_surface
+        if frame is None or frame.get_size() != surface.get_size():
+            frame = self._cached_surface = pygame.Surface(surface.get_size())
+            self._dirty = True
+        
+        if self._dirty:
+            frame.fill(self.colors['background'])
+            self._draw_grid(frame)
+            self._draw_numbers(frame)
+            self._draw_ui(frame)
+            self._draw_developer_credit(frame)
+            self._dirty = False
+        
+        surface.blit(frame, (0, 0))
 
     def handle_event(self, event):
+        # Only clicks and keys change what is drawn; mouse motion keeps the cached frame
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self._dirty = True
             self._handle_click(pygame.mouse.get_pos())
                 
         elif event.type == pygame.KEYDOWN:
+            self._dirty = True
             if not self.game_complete and self.selected_cell:
                 row, col = self.selected_cell
                 if self.board[row][col] == 0:
-                    if event.key in [pygame.K_1, pygame.K_KP1]:
-                        self._place_number(1)
-                    elif event.key in [pygame.K_2, pygame.K_KP2]:
-                        self._place_number(2)
-                    elif event.key in [pygame.K_3, pygame.K_KP3]:
-                        self._place_number(3)
-                    elif event.key in [pygame.K_4, pygame.K_KP4]:
-                        self._place_number(4)
-                    elif event.key in [pygame.K_5, pygame.K_KP5]:
-                        self._place_number(5)
-                    elif event.key in [pygame.K_6, pygame.K_KP6]:
-                        self._place_number(6)
-                    elif event.key in [pygame.K_7, pygame.K_KP7]:
-                        self._place_number(7)
-                    elif event.key in [pygame.K_8, pygame.K_KP8]:
-                        self._place_number(8)
-                    elif event.key in [pygame.K_9, pygame.K_KP9]:
-                        self._place_number(9)
+                    number = self._num_keys.get(event.key)
+                    if number is not None:
+                        self._place_number(number)
                     elif event.key == pygame.K_BACKSPACE or event.key == pygame.K_DELETE:
                         self._place_number(0)
                     elif event.key == pygame.K_h and self.hints_used < self.max_hints:
                         self._use_hint()
             
-            if event.key == pygame.K_r:
-                self.initialize()
-            elif event.key == pygame.K_n:
-                self._switch_level()
-            elif event.key == pygame.K_ESCAPE:
-                self.engine._return_to_menu()
+            command = self._cmd_keys.get(event.key)
+            if command is not None:
+                command()
 
     def _switch_level(self):
         levels_list = list(self.levels.keys())
@@ -172,11 +253,19 @@ class SudokuGame(BaseGame):
         if self.board[row][col] != 0:
             return
             
+        current = self.user_board[row][col]
+        self._dirty = True
         if number == 0:
+            if current:
+                self._toggle_mask(row, col, current)
+                self.cells_remaining += 1
             self.user_board[row][col] = 0
             return
             
         if self.solution[row][col] == number:
+            if current != number:
+                self._toggle_mask(row, col, number)
+                self.cells_remaining -= 1
             self.user_board[row][col] = number
         else:
             self.mistakes += 1
@@ -189,45 +278,45 @@ class SudokuGame(BaseGame):
             
         row, col = self.selected_cell
         if self.board[row][col] == 0 and self.user_board[row][col] == 0:
+            self._dirty = True
             self.user_board[row][col] = self.solution[row][col]
+            self._toggle_mask(row, col, self.solution[row][col])
+            self.cells_remaining -= 1
             self.hints_used += 1
 
-    def _draw_grid(self, surface):
-        board_x, board_y = self._get_board_position()
-        
-        board_rect = pygame.Rect(
-            board_x - 10, board_y - 10,
-            self.grid_size * self.cell_size + 20,
-            self.grid_size * self.cell_size + 20
-        )
-        pygame.draw.rect(surface, self.colors['grid_bg'], board_rect, border_radius=8)
+    def _build_grid_surface(self):
+        # Board background and grid lines relative to the board's 10px margin;
+        # transparent outside the rounded corners so it blits like drawing in place
+        board_size = self.grid_size * self.cell_size
+        grid_surf = pygame.Surface((board_size + 20, board_size + 20), pygame.SRCALPHA)
+        pygame.draw.rect(grid_surf, self.colors['grid_bg'], grid_surf.get_rect(), border_radius=8)
         
         for i in range(self.grid_size + 1):
             line_width = 3 if i % 3 == 0 else 1
+            offset = 10 + i * self.cell_size
             pygame.draw.line(
-                surface, self.colors['text_light'],
-                (board_x, board_y + i * self.cell_size),
-                (board_x + self.grid_size * self.cell_size, board_y + i * self.cell_size),
+                grid_surf, self.colors['text_light'],
+                (10, offset), (10 + board_size, offset),
                 line_width
             )
             pygame.draw.line(
-                surface, self.colors['text_light'],
-                (board_x + i * self.cell_size, board_y),
-                (board_x + i * self.cell_size, board_y + self.grid_size * self.cell_size),
+                grid_surf, self.colors['text_light'],
+                (offset, 10), (offset, 10 + board_size),
                 line_width
             )
+        return grid_surf
+
+    def _draw_grid(self, surface):
+        board_x, board_y = self._get_board_position()
+        surface.blit(self._grid_surf, (board_x - 10, board_y - 10))
         
         if self.selected_cell:
             row, col = self.selected_cell
-            selected_rect = pygame.Rect(
-                board_x + col * self.cell_size,
-                board_y + row * self.cell_size,
-                self.cell_size, self.cell_size
-            )
-            pygame.draw.rect(surface, self.colors['cell_selected'], selected_rect)
+            surface.fill(self.colors['cell_selected'], self._cell_rects[row][col])
 
     def _draw_numbers(self, surface):
-        board_x, board_y = self._get_board_position()
+        self._get_board_position()  # keeps _cell_rects in step with the screen size
+        cell_rects = self._cell_rects
         
         for row in range(self.grid_size):
             for col in range(self.grid_size):
@@ -235,11 +324,7 @@ class SudokuGame(BaseGame):
                 if cell_value == 0:
                     continue
                     
-                cell_rect = pygame.Rect(
-                    board_x + col * self.cell_size,
-                    board_y + row * self.cell_size,
-                    self.cell_size, self.cell_size
-                )
+                cell_rect = cell_rects[row][col]
                 
                 if self.board[row][col] != 0:
                     color = self.colors['text_light']
@@ -249,8 +334,7 @@ class SudokuGame(BaseGame):
                     else:
                         color = self.colors['text_error']
                 
-                font = pygame.font.Font(None, 36)
-                text = font.render(str(cell_value), True, color)
+                text = self._digit_surfs[color][cell_value]
                 text_rect = text.get_rect(center=cell_rect.center)
                 surface.blit(text, text_rect)
 
@@ -260,52 +344,55 @@ class SudokuGame(BaseGame):
         stats_panel = pygame.Rect(20, 20, 300, 160)
         self._draw_glass_panel(surface, stats_panel)
         
-        title_font = pygame.font.Font(None, 24)
-        stats_font = pygame.font.Font(None, 28)
-        small_font = pygame.font.Font(None, 20)
+        title_font = self._font_title
+        stats_font = self._font_stats
+        small_font = self._font_small
         
-        level_text = title_font.render(f"Nivel: {self.current_level}", True, self.colors['text_light'])
-        time_text = stats_font.render(f"Tempo: {int(self.elapsed_time)}s", True, self.colors['text_light'])
-        mistakes_text = stats_font.render(f"Erros: {self.mistakes}/{self.max_mistakes}", True, self.colors['text_light'])
-        hints_text = stats_font.render(f"Dicas: {self.hints_used}/{self.max_hints}", True, self.colors['text_light'])
+        level_text = self._text('level', title_font, f"Nivel: {self.current_level}", self.colors['text_light'])
+        time_text = self._text('time', stats_font, f"Tempo: {int(self.elapsed_time)}s", self.colors['text_light'])
+        mistakes_text = self._text('mistakes', stats_font, f"Erros: {self.mistakes}/{self.max_mistakes}", self.colors['text_light'])
+        hints_text = self._text('hints', stats_font, f"Dicas: {self.hints_used}/{self.max_hints}", self.colors['text_light'])
         
         surface.blit(level_text, (35, 30))
         surface.blit(time_text, (35, 60))
         surface.blit(mistakes_text, (35, 95))
         surface.blit(hints_text, (35, 125))
         
-        controls_text = small_font.render("N: Proximo Nivel | R: Reiniciar | H: Dica | ESC: Menu", True, (150, 200, 150))
+        controls_text = self._text('controls', small_font, "N: Proximo Nivel | R: Reiniciar | H: Dica | ESC: Menu", (150, 200, 150))
         surface.blit(controls_text, (35, 160))
         
         if self.game_complete:
-            overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            surface.blit(overlay, (0, 0))
+            size = surface.get_size()
+            if self._gameover_overlay_size != size:
+                self._gameover_overlay = pygame.Surface(size, pygame.SRCALPHA)
+                self._gameover_overlay.fill((0, 0, 0, 180))
+                self._gameover_overlay_size = size
+            surface.blit(self._gameover_overlay, (0, 0))
             
-            complete_font = pygame.font.Font(None, 48)
+            complete_font = self._font_complete
             if self.mistakes >= self.max_mistakes:
-                complete_text = complete_font.render("Game Over!", True, self.colors['text_error'])
+                complete_text = self._text('complete', complete_font, "Game Over!", self.colors['text_error'])
             else:
-                complete_text = complete_font.render("Sudoku Concluido!", True, self.colors['complete'])
+                complete_text = self._text('complete', complete_font, "Sudoku Concluido!", self.colors['complete'])
             
             surface.blit(complete_text, 
                         (surface.get_width() // 2 - complete_text.get_width() // 2, 
                          surface.get_height() // 2 - 60))
             
-            stats_font = pygame.font.Font(None, 32)
+            stats_font = self._font_result
             if self.mistakes < self.max_mistakes:
-                stats_text = stats_font.render(f"Resolvido em {int(self.elapsed_time)} segundos", True, (200, 200, 200))
+                stats_text = self._text('result', stats_font, f"Resolvido em {int(self.elapsed_time)} segundos", (200, 200, 200))
                 surface.blit(stats_text,
                             (surface.get_width() // 2 - stats_text.get_width() // 2,
                              surface.get_height() // 2))
             
-            restart_font = pygame.font.Font(None, 24)
-            restart_text = restart_font.render("Pressione R para jogar novamente ou ESC para menu", True, (150, 150, 150))
+            restart_font = self._font_title
+            restart_text = self._text('restart', restart_font, "Pressione R para jogar novamente ou ESC para menu", (150, 150, 150))
             surface.blit(restart_text,
                         (surface.get_width() // 2 - restart_text.get_width() // 2,
                          surface.get_height() // 2 + 50))
         else:
-            instruction_font = pygame.font.Font(None, 20)
+            instruction_font = self._font_small
             instructions = [
                 "Clique em uma celula e digite um numero (1-9)",
                 "Backspace/Del: Limpar celula",
@@ -313,27 +400,48 @@ class SudokuGame(BaseGame):
             ]
             
             for i, instruction in enumerate(instructions):
-                text = instruction_font.render(instruction, True, (180, 180, 180))
+                text = self._text(('instruction', i), instruction_font, instruction, (180, 180, 180))
                 surface.blit(text, (25, surface.get_height() - 90 + i * 22))
 
+    def _text(self, key, font, string, color):
+        cached = self._ui_cache.get(key)
+        if cached is None or cached[0] != string:
+            cached = (string, font.render(string, True, color))
+            self._ui_cache[key] = cached
+        return cached[1]
+
     def _draw_glass_panel(self, surface, rect):
-        panel_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        panel_surface.fill(self.colors['panel_bg'])
+        panel_surface = self._panel_cache.get(rect.size)
+        if panel_surface is None:
+            panel_surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+            panel_surface.fill(self.colors['panel_bg'])
+            self._panel_cache[rect.size] = panel_surface
         surface.blit(panel_surface, rect)
         pygame.draw.rect(surface, self.colors['panel_border'], rect, 2, border_radius=6)
 
     def _draw_developer_credit(self, surface):
-        credit_font = pygame.font.Font(None, 16)
+        credit_font = self._font_credit
         credit_text = "Developed by Gustavo Viana"
-        text_surface = credit_font.render(credit_text, True, (200, 200, 200))
+        text_surface = self._text('credit', credit_font, credit_text, (200, 200, 200))
         text_surface.set_alpha(150)
         text_rect = text_surface.get_rect()
         text_rect.bottomright = (surface.get_width() - 15, surface.get_height() - 15)
         surface.blit(text_surface, text_rect)
 
     def _get_board_position(self):
-        board_width = self.grid_size * self.cell_size
-        board_height = self.grid_size * self.cell_size
-        board_x = (self.engine.screen.get_width() - board_width) // 2
-        board_y = (self.engine.screen.get_height() - board_height) // 2
-        return board_x, board_y
+        # Recomputed, along with the cell rects, only when the screen size changes
+        screen_size = self.engine.screen.get_size()
+        if screen_size != self._board_pos_screen:
+            board_width = self.grid_size * self.cell_size
+            board_height = self.grid_size * self.cell_size
+            board_x = (screen_size[0] - board_width) // 2
+            board_y = (screen_size[1] - board_height) // 2
+            self._board_pos = (board_x, board_y)
+            self._board_pos_screen = screen_size
+            self._cell_rects = [
+                [pygame.Rect(board_x + col * self.cell_size, board_y + row * self.cell_size,
+                             self.cell_size, self.cell_size)
+                 for col in range(self.grid_size)]
+                for row in range(self.grid_size)
+            ]
+        return self._board_pos
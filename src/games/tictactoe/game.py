@@ -1,37 +1,166 @@
 import pygame
 import random
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
 from ..base_game import BaseGame
+from utils.helpers import get_font
+
+# Win lines in the order _check_winner has always reported them:
+# rows, columns, main diagonal, anti-diagonal
+_WIN_LINES: List[List[Tuple[int, int]]] = (
+    [[(row, col) for col in range(3)] for row in range(3)] +
+    [[(row, col) for row in range(3)] for col in range(3)] +
+    [[(i, i) for i in range(3)], [(i, 2 - i) for i in range(3)]]
+)
+
+# The same lines as 9-bit masks over cell index row * 3 + col
+_WIN_MASKS: List[int] = [sum(1 << (row * 3 + col) for row, col in line) for line in _WIN_LINES]
+_FULL_BOARD = 0x1FF
+
+
+def _build_win_tables() -> Tuple[Dict[int, str], Dict[int, List[Tuple[int, int]]]]:
+    """
+    Evaluate every base-3 packed board once
+    
+    Returns:
+        Tuple of (packed board -> winner, packed board -> winning line),
+        holding entries only for boards that have a winner
+    """
+    winners = {}
+    lines = {}
+    
+    for packed in range(3 ** 9):
+        # Cell (0, 0) is the most significant base-3 digit, matching _TERNARY
+        x_mask = o_mask = 0
+        value = packed
+        for index in range(8, -1, -1):
+            value, digit = divmod(value, 3)
+            if digit == 1:
+                x_mask |= 1 << index
+            elif digit == 2:
+                o_mask |= 1 << index
+                
+        for line, mask in zip(_WIN_LINES, _WIN_MASKS):
+            if x_mask & mask == mask:
+                winners[packed] = "X"
+            elif o_mask & mask == mask:
+                winners[packed] = "O"
+            else:
+                continue
+            lines[packed] = line
+            break
+            
+    return winners, lines
+
+
+_WIN_TABLE, _WIN_LINE_TABLE = _build_win_tables()
+
+# Base-3 weight of each 9-bit mask with cell (0, 0) most significant, so a
+# board packs as _TERNARY[x_bb] + 2 * _TERNARY[o_bb]
+_TERNARY: List[int] = [
+    sum(3 ** (8 - index) for index in range(9) if mask >> index & 1)
+    for mask in range(1 << 9)
+]
+
+
+@lru_cache(maxsize=None)
+def _solve(own: int, other: int) -> Tuple[int, Tuple[int, ...]]:
+    """
+    Negamax search for the player to move
+    
+    Args:
+        own: Bitboard of the player to move
+        other: Bitboard of the opponent
+        
+    Returns:
+        Tuple of (score, best cell indices). A win scores one more than the
+        number of cells left empty, so faster wins rank higher; draws score 0
+    """
+    free = _FULL_BOARD & ~(own | other)
+    best_score = None
+    best_moves: List[int] = []
+    
+    for index in range(9):
+        bit = 1 << index
+        if not free & bit:
+            continue
+            
+        after = own | bit
+        if any(after & mask == mask for mask in _WIN_MASKS):
+            score = 1 + bin(free ^ bit).count("1")
+        elif free == bit:
+            score = 0
+        else:
+            score = -_solve(other, after)[0]
+            
+        if best_score is None or score > best_score:
+            best_score = score
+            best_moves = [index]
+        elif score == best_score:
+            best_moves.append(index)
+            
+    return best_score or 0, tuple(best_moves)
+
+
+# Fill the cache with every reachable position up front
+_solve(0, 0)
+
 
 class TicTacToeGame(BaseGame):
     """Professional Tic-Tac-Toe implementation with AI"""
     
+    MARK_PADDING = 8
+    
     def __init__(self, engine):
         super().__init__(engine, "tictactoe")
         self.board_size = 3
         self.cell_size = 100
         self.board_margin = 50
-        self.board: List[List[Optional[str]]] = []
+        # Occupied cells as 9-bit masks, bit row * 3 + col
+        self.x_bb = 0
+        self.o_bb = 0
         self.current_player = "X"
         self.game_over = False
         self.winner: Optional[str] = None
         self.winning_line: Optional[List[Tuple[int, int]]] = None
+        self.ai_delay_ms = 500
+        self._pending_ai_move: Optional[Tuple[int, int]] = None
+        self._ai_move_at = 0
+        
+        # Fonts come from the shared cache instead of being built per frame
+        self._font_status = get_font(36)
+        self._font_instruction = get_font(24)
+        self._font_credit = get_font(18)
+        
+        # Board background and grid, rebuilt only when the surface size changes
+        self._bg_surf: Optional[pygame.Surface] = None
+        self._bg_size: Optional[Tuple[int, int]] = None
+        self._board_origin = (0, 0)
+        self._mark_positions: List[Tuple[int, int]] = []
+        self._mark_surfs = self._build_mark_surfaces()
         
         self.initialize()
         
     def initialize(self):
         """Initialize game state"""
-        self.board = [[None for _ in range(self.board_size)] for _ in range(self.board_size)]
+        self.x_bb = 0
+        self.o_bb = 0
         self.current_player = "X"
         self.game_over = False
         self.winner = None
         self.winning_line = None
+        self._pending_ai_move = None
         
     def update(self, delta_time: float):
         """Update game logic"""
         # AI move if it's computer's turn and game isn't over
         if not self.game_over and self.current_player == "O":
-            self._make_ai_move()
+            if self._pending_ai_move is None:
+                self._schedule_ai_move()
+            elif pygame.time.get_ticks() >= self._ai_move_at:
+                row, col = self._pending_ai_move
+                self._pending_ai_move = None
+                self._make_move(row, col)
             
     def render(self, surface: pygame.Surface):
         """Render game to surface"""
@@ -47,48 +176,76 @@ class TicTacToeGame(BaseGame):
                 
     def _draw_board(self, surface: pygame.Surface):
         """Draw Tic-Tac-Toe board"""
+        if surface.get_size() != self._bg_size:
+            self._build_board_background(surface.get_size())
+        board_x, board_y = self._board_origin
+        
+        # Draw board background and grid lines
+        surface.blit(self._bg_surf, (board_x - 10, board_y - 10))
+        
+        # Draw X's and O's
+        x_surf = self._mark_surfs["X"]
+        o_surf = self._mark_surfs["O"]
+        x_bb, o_bb = self.x_bb, self.o_bb
+        for index, position in enumerate(self._mark_positions):
+            bit = 1 << index
+            if x_bb & bit:
+                surface.blit(x_surf, position)
+            elif o_bb & bit:
+                surface.blit(o_surf, position)
+        
+        # Draw winning line
+        if self.winning_line:
+            self._draw_winning_line(surface, board_x, board_y)
+            
+    def _build_board_background(self, size: Tuple[int, int]):
+        """
+        Pre-render the board background and grid for a surface size
+        
+        Args:
+            size: Width and height of the surface the board is centered on
+        """
         board_width = self.board_size * self.cell_size
         board_height = self.board_size * self.cell_size
-        board_x = (surface.get_width() - board_width) // 2
-        board_y = (surface.get_height() - board_height) // 2 - 50
+        board_x = (size[0] - board_width) // 2
+        board_y = (size[1] - board_height) // 2 - 50
         
-        # Draw board background
-        board_rect = pygame.Rect(board_x - 10, board_y - 10, 
-                               board_width + 20, board_height + 20)
-        pygame.draw.rect(surface, (50, 50, 80), board_rect, border_radius=8)
-        pygame.draw.rect(surface, (80, 80, 120), board_rect, 2, border_radius=8)
+        # Transparent outside the rounded corners, like drawing it in place
+        background = pygame.Surface((board_width + 20, board_height + 20), pygame.SRCALPHA)
+        board_rect = background.get_rect()
+        pygame.draw.rect(background, (50, 50, 80), board_rect, border_radius=8)
+        pygame.draw.rect(background, (80, 80, 120), board_rect, 2, border_radius=8)
         
-        # Draw grid lines
         for i in range(1, self.board_size):
             # Vertical lines
-            x = board_x + i * self.cell_size
-            pygame.draw.line(surface, (100, 100, 140), 
-                           (x, board_y), (x, board_y + board_height), 4)
+            x = 10 + i * self.cell_size
+            pygame.draw.line(background, (100, 100, 140),
+                           (x, 10), (x, 10 + board_height), 4)
             # Horizontal lines
-            y = board_y + i * self.cell_size
-            pygame.draw.line(surface, (100, 100, 140),
-                           (board_x, y), (board_x + board_width, y), 4)
+            y = 10 + i * self.cell_size
+            pygame.draw.line(background, (100, 100, 140),
+                           (10, y), (10 + board_width, y), 4)
         
-        # Draw X's and O's
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                cell_value = self.board[row][col]
-                if cell_value:
-                    cell_rect = pygame.Rect(
-                        board_x + col * self.cell_size + 10,
-                        board_y + row * self.cell_size + 10,
-                        self.cell_size - 20,
-                        self.cell_size - 20
-                    )
-                    
-                    if cell_value == "X":
-                        self._draw_x(surface, cell_rect)
-                    else:
-                        self._draw_o(surface, cell_rect)
+        # Mark surfaces are padded so wide strokes are not clipped
+        pad = self.MARK_PADDING
+        self._mark_positions = [
+            (board_x + col * self.cell_size + 10 - pad, board_y + row * self.cell_size + 10 - pad)
+            for row in range(self.board_size) for col in range(self.board_size)
+        ]
+        self._board_origin = (board_x, board_y)
+        self._bg_surf = background
+        self._bg_size = size
         
-        # Draw winning line
-        if self.winning_line:
-            self._draw_winning_line(surface, board_x, board_y)
+    def _build_mark_surfaces(self) -> Dict[str, pygame.Surface]:
+        """Pre-render the X and O symbols for one cell"""
+        pad = self.MARK_PADDING
+        mark_size = self.cell_size - 20
+        surfaces = {}
+        for value, draw in (("X", self._draw_x), ("O", self._draw_o)):
+            mark = pygame.Surface((mark_size + 2 * pad, mark_size + 2 * pad), pygame.SRCALPHA)
+            draw(mark, pygame.Rect(pad, pad, mark_size, mark_size))
+            surfaces[value] = mark
+        return surfaces
             
     def _draw_x(self, surface: pygame.Surface, rect: pygame.Rect):
         """Draw X symbol"""
@@ -120,7 +277,7 @@ class TicTacToeGame(BaseGame):
         
     def _draw_status(self, surface: pygame.Surface):
         """Draw game status information"""
-        status_font = pygame.font.Font(None, 36)
+        status_font = self._font_status
         
         if self.game_over:
             if self.winner:
@@ -139,7 +296,7 @@ class TicTacToeGame(BaseGame):
                      surface.get_height() - 100))
         
         # Draw instructions
-        instruction_font = pygame.font.Font(None, 24)
+        instruction_font = self._font_instruction
         instruction_text = "Click to place X | ESC to return to menu"
         instruction_surface = instruction_font.render(instruction_text, True, (150, 150, 150))
         surface.blit(instruction_surface,
@@ -148,7 +305,7 @@ class TicTacToeGame(BaseGame):
         
     def _draw_developer_credit(self, surface: pygame.Surface):
         """Render professional developer credit"""
-        credit_font = pygame.font.Font(None, 18)
+        credit_font = self._font_credit
         credit_text = "Developed by Gustavo Viana"
         
         # Create surface with alpha for transparency
@@ -181,42 +338,27 @@ class TicTacToeGame(BaseGame):
                 
     def _make_move(self, row: int, col: int):
         """Make a move at specified position"""
-        if self.board[row][col] is None and not self.game_over:
-            self.board[row][col] = self.current_player
+        bit = 1 << (row * self.board_size + col)
+        if not (self.x_bb | self.o_bb) & bit and not self.game_over:
+            if self.current_player == "X":
+                self.x_bb |= bit
+            else:
+                self.o_bb |= bit
             self._check_game_state()
             
             if not self.game_over:
                 self.current_player = "O" if self.current_player == "X" else "X"
                 
-    def _make_ai_move(self):
-        """Make AI move with simple strategy"""
-        # Simple AI: try to win, then block, then random
-        move = self._find_winning_move("O") or self._find_winning_move("X") or self._find_random_move()
+    def _schedule_ai_move(self):
+        """Pick the best AI move, choosing randomly among equally good ones"""
+        _, moves = _solve(self.o_bb, self.x_bb)
         
-        if move:
-            # Add small delay for natural feel
-            pygame.time.delay(500)
-            self._make_move(move[0], move[1])
+        if moves:
+            # Played by update() after a short delay for natural feel,
+            # without blocking the event loop in the meantime
+            self._pending_ai_move = divmod(random.choice(moves), self.board_size)
+            self._ai_move_at = pygame.time.get_ticks() + self.ai_delay_ms
             
-    def _find_winning_move(self, player: str) -> Optional[Tuple[int, int]]:
-        """Find a winning move for specified player"""
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                if self.board[row][col] is None:
-                    # Test if this move would win
-                    self.board[row][col] = player
-                    if self._check_winner() == player:
-                        self.board[row][col] = None
-                        return (row, col)
-                    self.board[row][col] = None
-        return None
-        
-    def _find_random_move(self) -> Optional[Tuple[int, int]]:
-        """Find a random valid move"""
-        empty_cells = [(r, c) for r in range(self.board_size) for c in range(self.board_size) 
-                      if self.board[r][c] is None]
-        return random.choice(empty_cells) if empty_cells else None
-        
     def _check_game_state(self):
         """Check if game has ended"""
         winner = self._check_winner()
@@ -228,30 +370,12 @@ class TicTacToeGame(BaseGame):
             
     def _check_winner(self) -> Optional[str]:
         """Check if there's a winner"""
-        # Check rows
-        for row in range(self.board_size):
-            if self.board[row][0] and all(self.board[row][0] == self.board[row][col] for col in range(self.board_size)):
-                self.winning_line = [(row, col) for col in range(self.board_size)]
-                return self.board[row][0]
-                
-        # Check columns
-        for col in range(self.board_size):
-            if self.board[0][col] and all(self.board[0][col] == self.board[row][col] for row in range(self.board_size)):
-                self.winning_line = [(row, col) for row in range(self.board_size)]
-                return self.board[0][col]
-                
-        # Check diagonals
-        if self.board[0][0] and all(self.board[0][0] == self.board[i][i] for i in range(self.board_size)):
-            self.winning_line = [(i, i) for i in range(self.board_size)]
-            return self.board[0][0]
-            
-        if self.board[0][self.board_size-1] and all(self.board[0][self.board_size-1] == self.board[i][self.board_size-1-i] for i in range(self.board_size)):
-            self.winning_line = [(i, self.board_size-1-i) for i in range(self.board_size)]
-            return self.board[0][self.board_size-1]
-            
-        return None
+        packed = _TERNARY[self.x_bb] + 2 * _TERNARY[self.o_bb]
+        winner = _WIN_TABLE.get(packed)
+        if winner:
+            self.winning_line = list(_WIN_LINE_TABLE[packed])
+        return winner
         
     def _is_board_full(self) -> bool:
         """Check if board is completely filled"""
-        return all(self.board[row][col] is not None 
-                  for row in range(self.board_size) for col in range(self.board_size))
+        return self.x_bb | self.o_bb == _FULL_BOARD
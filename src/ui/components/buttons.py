@@ -1,5 +1,6 @@
 import pygame
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
+from utils.helpers import get_font
 
 class Button:
     """Professional button component with hover and click effects"""
@@ -21,8 +22,18 @@ class Button:
         self.border_color = (90, 90, 130)
         self.shadow_color = (20, 20, 40)
         
+        # Normal and hover colors packed as 0x00BBGGRR for blending in one word
+        self._normal_packed = self._pack_color(self.normal_color)
+        self._hover_packed = self._pack_color(self.hover_color)
+        self._blend_t = None
+        self._blend_color = self.normal_color
+        
         # Font
-        self.font = pygame.font.Font(None, 26)  # Slightly smaller for better fit
+        self.font = get_font(26)  # Slightly smaller for better fit
+        self.set_text(text)
+        
+        # Composited button plus overlay surfaces for the glow and click effects
+        self._rebuild_cache()
         
     def update(self, delta_time: float):
         """Update button animations"""
@@ -35,52 +46,114 @@ class Button:
             
     def render(self, surface: pygame.Surface):
         """Render button with professional appearance"""
+        surface.blit(*self.get_blit_pair())
+        
+    def get_blit_pair(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Get the composited button and its screen position
+        
+        The composite is redrawn only when the button's look changes, so a
+        menu can pass all of its buttons to a single Surface.blits call.
+        
+        Returns:
+            Tuple of (button surface including its shadow, top-left position)
+        """
+        if self.rect.size != self._cache_size:
+            self._rebuild_cache()
+            
+        state = self.appearance()
+        if state != self._composite_state:
+            self._compose(*state)
+            self._composite_state = state
+            
+        return self._composite, self.rect.topleft
+        
+    def appearance(self) -> Tuple:
+        """
+        Get the values that decide how the button currently looks
+        
+        Returns:
+            Tuple of (fill color, glow alpha or None, click highlight alpha or None);
+            two frames with equal tuples render identically
+        """
+        current_color = self._get_current_color()
+        glow_alpha = int(30 * self.hover_progress) if self.hover_progress > 0 else None  # Subtle glow
+        click_alpha = int(80 * (1.0 - self.hover_progress)) if self.clicked else None
+        return current_color, glow_alpha, click_alpha
+        
+    def _compose(self, current_color, glow_alpha: Optional[int], click_alpha: Optional[int]):
+        """Redraw the composite surface for the given state"""
+        composite = self._composite
+        composite.fill((0, 0, 0, 0))
+        body = pygame.Rect((0, 0), self.rect.size)
+        
         # Draw shadow for depth
-        shadow_rect = self.rect.move(4, 4)
-        pygame.draw.rect(surface, self.shadow_color, shadow_rect, border_radius=8)
+        pygame.draw.rect(composite, self.shadow_color, body.move(4, 4), border_radius=8)
         
         # Draw button background with current state color
-        current_color = self._get_current_color()
-        pygame.draw.rect(surface, current_color, self.rect, border_radius=8)
+        pygame.draw.rect(composite, current_color, body, border_radius=8)
         
         # Draw subtle border
-        pygame.draw.rect(surface, self.border_color, self.rect, 2, border_radius=8)
+        pygame.draw.rect(composite, self.border_color, body, 2, border_radius=8)
         
         # Draw text with professional typography
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        composite.blit(self._text_surf, self._text_surf.get_rect(center=body.center))
         
         # Draw hover glow effect
-        if self.hover_progress > 0:
-            glow_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-            glow_color = (255, 255, 255, int(30 * self.hover_progress))  # Subtle glow
-            pygame.draw.rect(glow_surface, glow_color, glow_surface.get_rect(), border_radius=8)
-            surface.blit(glow_surface, self.rect)
+        if glow_alpha is not None:
+            self._paint_overlay(self._glow_surf, glow_alpha)
+            composite.blit(self._glow_surf, body)
             
         # Draw click effect (brief highlight)
-        if self.clicked:
-            highlight_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-            highlight_color = (255, 255, 255, int(80 * (1.0 - self.hover_progress)))
-            pygame.draw.rect(highlight_surface, highlight_color, highlight_surface.get_rect(), border_radius=8)
-            surface.blit(highlight_surface, self.rect)
+        if click_alpha is not None:
+            self._paint_overlay(self._click_surf, click_alpha)
+            composite.blit(self._click_surf, body)
+            
+    def _rebuild_cache(self):
+        """Allocate the composite and overlay surfaces for the current button size"""
+        self._cache_size = self.rect.size
+        width, height = self._cache_size
+        # Room for the shadow offset below and to the right of the button
+        self._composite = pygame.Surface((width + 4, height + 4), pygame.SRCALPHA)
+        self._glow_surf = pygame.Surface(self._cache_size, pygame.SRCALPHA)
+        self._click_surf = pygame.Surface(self._cache_size, pygame.SRCALPHA)
+        # State currently drawn into the composite; None forces a redraw
+        self._composite_state = None
+        
+    def _paint_overlay(self, overlay: pygame.Surface, alpha: int):
+        """Repaint an overlay as a rounded white rect with the given alpha"""
+        overlay.fill((0, 0, 0, 0))
+        pygame.draw.rect(overlay, (255, 255, 255, alpha), overlay.get_rect(), border_radius=8)
             
     def _get_current_color(self):
         """Get color based on button state with smooth interpolation"""
         if self.clicked:
             return self.click_color
             
-        # Smooth interpolation between normal and hover colors
-        r = int(self.normal_color[0] + (self.hover_color[0] - self.normal_color[0]) * self.hover_progress)
-        g = int(self.normal_color[1] + (self.hover_color[1] - self.normal_color[1]) * self.hover_progress)
-        b = int(self.normal_color[2] + (self.hover_color[2] - self.normal_color[2]) * self.hover_progress)
+        # Smooth interpolation between normal and hover colors in 1/256 steps,
+        # clamped so an overshooting hover_progress cannot carry between channels
+        t = min(max(int(self.hover_progress * 256), 0), 256)
+        if t != self._blend_t:
+            inv = 256 - t
+            normal = self._normal_packed
+            hover = self._hover_packed
+            # Red and blue blend together in separate 16-bit lanes, then green
+            red_blue = ((normal & 0xFF00FF) * inv + (hover & 0xFF00FF) * t) >> 8 & 0xFF00FF
+            green = ((normal & 0x00FF00) * inv + (hover & 0x00FF00) * t) >> 8 & 0x00FF00
+            packed = red_blue | green
+            self._blend_color = (packed & 0xFF, packed >> 8 & 0xFF, packed >> 16)
+            self._blend_t = t
+            
+        return self._blend_color
         
-        return (r, g, b)
+    @staticmethod
+    def _pack_color(color) -> int:
+        """Pack an RGB tuple as 0x00BBGGRR"""
+        return color[0] | color[1] << 8 | color[2] << 16
         
     def is_clicked(self, mouse_pos) -> bool:
         """Check if button is being clicked"""
-        mouse_rect = pygame.Rect(mouse_pos[0], mouse_pos[1], 1, 1)
-        return self.rect.colliderect(mouse_rect)
+        return self.rect.collidepoint(mouse_pos)
         
     def click(self):
         """Handle button click"""
@@ -88,6 +161,12 @@ class Button:
         if self.callback:
             self.callback()
             
+    def set_text(self, text: str):
+        """Change the label and render it once for reuse every frame"""
+        self.text = text
+        self._text_surf = self.font.render(text, True, self.text_color)
+        self._composite_state = None
+        
     def set_hovered(self, hovered: bool):
         """Set hover state"""
         self.hovered = hovered
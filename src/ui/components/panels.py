@@ -1,5 +1,5 @@
 import pygame
-from typing import Tuple
+from typing import Optional, Tuple
 
 class Panel:
     """Professional panel component for UI organization"""
@@ -10,14 +10,32 @@ class Panel:
         self.rect = pygame.Rect(x, y, width, height)
         self.color = color
         self.border_color = border_color
+        self._cached: Optional[pygame.Surface] = None
+        self._cached_key = None
         
     def render(self, surface: pygame.Surface):
         """Render panel with border"""
+        key = (self.rect.size, self.color, self.border_color)
+        if key != self._cached_key:
+            self._build_surface()
+            self._cached_key = key
+            
+        surface.blit(self._cached, self.rect.topleft)
+        
+    def _build_surface(self):
+        """Draw the rounded panel once; corners outside the radius stay transparent"""
+        panel = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local_rect = panel.get_rect()
+        
         # Draw panel background
-        pygame.draw.rect(surface, self.color, self.rect, border_radius=6)
+        pygame.draw.rect(panel, self.color, local_rect, border_radius=6)
         
         # Draw border
-        pygame.draw.rect(surface, self.border_color, self.rect, 2, border_radius=6)
+        pygame.draw.rect(panel, self.border_color, local_rect, 2, border_radius=6)
+        
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert_alpha()
+        self._cached = panel
         
     def contains_point(self, point: Tuple[int, int]) -> bool:
         """Check if point is inside panel"""
@@ -21,6 +21,9 @@ class TextElement:
     def _update_surface(self):
         """Update text surface"""
         self.surface = self.font.render(self.text, True, self.color)
+        if pygame.display.get_surface() is not None:
+            # Match the display format so each blit skips per-pixel conversion
+            self.surface = self.surface.convert_alpha()
         self.rect = self.surface.get_rect()
         
         if self.centered:
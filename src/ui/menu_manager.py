@@ -1,62 +1,123 @@
 import pygame
-from typing import List, Dict, Any, Optional, Callable
+import importlib
+from enum import IntEnum
+from functools import partial
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from utils.helpers import get_font
+from utils.logger import get_logger
 from .components.buttons import Button
 from .components.panels import Panel
 
+class MenuId(IntEnum):
+    """Menu screens, usable as indexes into per-menu tables"""
+    MAIN = 0
+    GAME_SELECT = 1
+    SETTINGS = 2
+
 class MenuManager:
     """Professional menu management system for Game Suite"""
     
+    # Module path and class name of each playable game, imported on first selection
+    _GAME_MODULES = {
+        "tictactoe": ("games.tictactoe.game", "TicTacToeGame"),
+        "memory": ("games.memory.game", "MemoryGame"),
+        "puzzle_2048": ("games.puzzle_2048.game", "Puzzle2048Game"),
+        "sliding": ("games.sliding.game", "SlidingPuzzleGame"),
+        "snake": ("games.snake.game", "SnakeGame"),
+        "sudoku": ("games.sudoku.game", "SudokuGame")
+    }
+    
     def __init__(self, engine):
         self.engine = engine
-        self.current_menu = "main"
+        self.current_menu = MenuId.MAIN
         self.menus: Dict[str, Any] = {}
         self.buttons: Dict[str, Button] = {}
         self.panels: Dict[str, Panel] = {}
         self.click_cooldown = 0.0
+        self._loaded_games: Dict[str, type] = {}
+        
+        # Last hover result, so pointer motion within one button is a no-op
+        self._last_hover_menu: Optional[MenuId] = None
+        self._last_hover_pos = (-1, -1)
+        self._last_hovered: Optional[Button] = None
+        
+        # Background fill and grid pattern, redrawn only when the screen size changes
+        self._bg_cache: Optional[pygame.Surface] = None
+        self._bg_size: Optional[Tuple[int, int]] = None
+        
+        # Last composed menu frame and the state it was drawn from
+        self._cached_frame: Optional[pygame.Surface] = None
+        self._frame_key: Optional[Tuple] = None
+        
+        # Render method per menu, indexed by MenuId
+        self._menu_renderers: Tuple[Callable[[pygame.Surface], None], ...] = (
+            self._render_main_menu,
+            self._render_game_select_menu,
+            self._render_settings_menu
+        )
         
         self._initialize_menus()
         
     def _initialize_menus(self):
         """Initialize all menu systems"""
+        self._screen_size = self.engine.screen.get_size()
+        self._menu_buttons: Dict[MenuId, List[Button]] = {menu: [] for menu in MenuId}
         self._create_main_menu()
         self._create_game_select_menu()
         self._create_settings_menu()
+        self._create_static_text()
+        self._index_menu_buttons()
+        
+    def refresh_layout(self):
+        """Rebuild the menus if the screen size has changed since they were laid out"""
+        if self.engine.screen.get_size() == self._screen_size:
+            return
+            
+        self.buttons.clear()
+        self._last_hover_menu = None
+        self._last_hovered = None
+        self._initialize_menus()
+        
+    def _add_button(self, menu: MenuId, button_id: str, button: Button):
+        """Register a button under its id and in the menu that shows it"""
+        self.buttons[button_id] = button
+        self._menu_buttons[menu].append(button)
         
     def _create_main_menu(self):
         """Create the main menu interface"""
-        screen_width, screen_height = self.engine.screen.get_size()
+        screen_width, screen_height = self._screen_size
         
         # Main menu buttons
-        self.buttons["start_game"] = Button(
+        self._add_button(MenuId.MAIN, "start_game", Button(
             x=screen_width // 2 - 100,
             y=screen_height // 2 - 60,
             width=200,
             height=50,
             text="Start Game",
             callback=self._on_start_game
-        )
+        ))
         
-        self.buttons["settings"] = Button(
+        self._add_button(MenuId.MAIN, "settings", Button(
             x=screen_width // 2 - 100,
             y=screen_height // 2,
             width=200,
             height=50,
             text="Settings",
             callback=self._on_settings
-        )
+        ))
         
-        self.buttons["quit"] = Button(
+        self._add_button(MenuId.MAIN, "quit", Button(
             x=screen_width // 2 - 100,
             y=screen_height // 2 + 60,
             width=200,
             height=50,
             text="Quit Game",
             callback=self._on_quit
-        )
+        ))
         
     def _create_game_select_menu(self):
         """Create game selection menu with centered layout"""
-        screen_width, screen_height = self.engine.screen.get_size()
+        screen_width, screen_height = self._screen_size
         
         # Game selection buttons - centered grid layout
         games = [
@@ -85,46 +146,72 @@ class MenuManager:
             x = grid_x + col * 200 + 10  # 200px per column, 10px margin
             y = grid_y + row * 70 + 10   # 70px per row, 10px margin
             
-            self.buttons[f"game_{game_id}"] = Button(
+            self._add_button(MenuId.GAME_SELECT, f"game_{game_id}", Button(
                 x=x, y=y, width=180, height=50,
                 text=game_name,
-                callback=lambda gid=game_id: self._on_game_select(gid)
-            )
+                callback=partial(self._on_game_select, game_id)
+            ))
         
         # Back button - centered at bottom
-        self.buttons["back_to_main"] = Button(
+        self._add_button(MenuId.GAME_SELECT, "back_to_main", Button(
             x=screen_width // 2 - 100,
             y=screen_height - 80,
             width=200, height=50,
             text="Back to Main",
             callback=self._on_back_to_main
-        )
+        ))
         
     def _create_settings_menu(self):
         """Create settings menu (placeholder)"""
-        screen_width, screen_height = self.engine.screen.get_size()
+        screen_width, screen_height = self._screen_size
         
-        self.buttons["settings_back"] = Button(
+        self._add_button(MenuId.SETTINGS, "settings_back", Button(
             x=screen_width // 2 - 100,
             y=screen_height - 80,
             width=200, height=50,
             text="Back",
             callback=self._on_back_to_main
-        )
+        ))
+        
+    def _create_static_text(self):
+        """Pre-render the menus' fixed titles and labels with their positions"""
+        screen_width, screen_height = self._screen_size
+        can_convert = pygame.display.get_surface() is not None
+        self._static_text: Dict[str, Tuple[pygame.Surface, Tuple[int, int]]] = {}
+        
+        def add(key, size, text, color, y):
+            text_surface = get_font(size).render(text, True, color)
+            if can_convert:
+                text_surface = text_surface.convert_alpha()
+            self._static_text[key] = (text_surface, (screen_width // 2 - text_surface.get_width() // 2, y))
+            
+        add("title_main", 64, "GAME SUITE", (255, 255, 255), 100)
+        add("subtitle_main", 24, "Professional Game Collection", (200, 200, 200), 170)
+        add("title_game_select", 48, "Select Game", (255, 255, 255), 80)
+        add("title_settings", 48, "Settings", (255, 255, 255), 80)
+        add("settings_placeholder", 32, "Settings Menu - Under Development", (200, 200, 200), 200)
+        
+        # Developer credit at 50% opacity, anchored bottom right with margin
+        credit_surface = get_font(18).render("Developed by Gustavo Viana", True, (200, 200, 200))
+        if can_convert:
+            credit_surface = credit_surface.convert_alpha()
+        credit_surface.set_alpha(128)
+        credit_rect = credit_surface.get_rect(bottomright=(screen_width - 20, screen_height - 20))
+        self._static_text["credit"] = (credit_surface, credit_rect.topleft)
         
     def _on_start_game(self):
         """Handle start game button click"""
         if self.click_cooldown <= 0:
-            self.current_menu = "game_select"
+            self.current_menu = MenuId.GAME_SELECT
             self.click_cooldown = 0.3  # 300ms cooldown
-            print("Navigating to game selection")
+            get_logger().debug("Navigating to game selection")
         
     def _on_settings(self):
         """Handle settings button click"""
         if self.click_cooldown <= 0:
-            self.current_menu = "settings"
+            self.current_menu = MenuId.SETTINGS
             self.click_cooldown = 0.3
-            print("Navigating to settings")
+            get_logger().debug("Navigating to settings")
         
     def _on_quit(self):
         """Handle quit button click"""
@@ -136,83 +223,104 @@ class MenuManager:
         if self.click_cooldown > 0:
             return
             
-        print(f"Selected game: {game_id}")
+        get_logger().debug("Selected game: %s", game_id)
         self.click_cooldown = 0.5  # 500ms cooldown for game loading
         
+        module_info = self._GAME_MODULES.get(game_id)
+        if module_info is None:
+            # Placeholder for domino and tetris games
+            get_logger().debug("%s game selected - not yet implemented", game_id.capitalize())
+            return
+            
         # Import and switch to the selected game
         try:
-            if game_id == "tictactoe":
-                from games.tictactoe.game import TicTacToeGame
-                self.engine.switch_to_game(TicTacToeGame)
-            elif game_id == "memory":
-                from games.memory.game import MemoryGame
-                self.engine.switch_to_game(MemoryGame)
-            elif game_id == "puzzle_2048":
-                from games.puzzle_2048.game import Puzzle2048Game
-                self.engine.switch_to_game(Puzzle2048Game)
-            elif game_id == "sliding":
-                from games.sliding.game import SlidingPuzzleGame
-                self.engine.switch_to_game(SlidingPuzzleGame)
-            elif game_id == "snake":
-                from games.snake.game import SnakeGame
-                self.engine.switch_to_game(SnakeGame)
-            elif game_id == "sudoku":
-                from games.sudoku.game import SudokuGame
-                self.engine.switch_to_game(SudokuGame)
-            elif game_id == "domino":
-                # Placeholder for domino game
-                print("Domino game selected - not yet implemented")
-            elif game_id == "tetris":
-                # Placeholder for tetris game
-                print("Tetris game selected - not yet implemented")
+            game_class = self._loaded_games.get(game_id)
+            if game_class is None:
+                module_name, class_name = module_info
+                game_class = getattr(importlib.import_module(module_name), class_name)
+                self._loaded_games[game_id] = game_class
+            self.engine.switch_to_game(game_class)
                 
         except ImportError as e:
-            print(f"Error loading game {game_id}: {e}")
+            get_logger().error("Error loading game %s: %s", game_id, e)
             
     def _on_back_to_main(self):
         """Handle back to main menu"""
         if self.click_cooldown <= 0:
-            self.current_menu = "main"
+            self.current_menu = MenuId.MAIN
             self.click_cooldown = 0.3
         
     def handle_event(self, event: pygame.event.Event):
         """Handle menu events"""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mouse_pos = pygame.mouse.get_pos()
-            self._handle_click(mouse_pos)
+            self._handle_click(event.pos)
             
         # Update button hover states
         if event.type == pygame.MOUSEMOTION:
-            mouse_pos = pygame.mouse.get_pos()
-            self._update_hover_states(mouse_pos)
+            self._update_hover_states(event.pos)
+            
+        if event.type == pygame.VIDEORESIZE:
+            self.refresh_layout()
             
     def _handle_click(self, mouse_pos):
         """Handle mouse clicks on menu elements"""
         if self.click_cooldown > 0:
             return
             
-        for button_id, button in self.buttons.items():
-            # Only process buttons for current menu
-            if self._is_button_in_current_menu(button_id):
-                if button.is_clicked(mouse_pos):
-                    button.click()
+        # Only process buttons for current menu
+        button = self._hit_test(mouse_pos)
+        if button:
+            button.click()
                     
     def _update_hover_states(self, mouse_pos):
         """Update hover states for all buttons"""
-        for button_id, button in self.buttons.items():
-            if self._is_button_in_current_menu(button_id):
-                button.set_hovered(button.is_clicked(mouse_pos))
-                    
-    def _is_button_in_current_menu(self, button_id: str) -> bool:
-        """Check if button belongs to current menu"""
-        if self.current_menu == "main":
-            return button_id in ["start_game", "settings", "quit"]
-        elif self.current_menu == "game_select":
-            return button_id.startswith("game_") or button_id == "back_to_main"
-        elif self.current_menu == "settings":
-            return button_id == "settings_back"
-        return False
+        same_menu = self._last_hover_menu == self.current_menu
+        if same_menu:
+            if mouse_pos == self._last_hover_pos:
+                return
+            if self._last_hovered is not None and self._last_hovered.rect.collidepoint(mouse_pos):
+                self._last_hover_pos = mouse_pos
+                return
+                
+        hovered = self._hit_test(mouse_pos)
+        if same_menu:
+            # Only the previous and the new hovered button can have changed
+            if hovered is not self._last_hovered:
+                if self._last_hovered is not None:
+                    self._last_hovered.set_hovered(False)
+                if hovered is not None:
+                    hovered.set_hovered(True)
+        else:
+            for button in self._menu_buttons[self.current_menu]:
+                button.set_hovered(button is hovered)
+                
+        self._last_hover_menu = self.current_menu
+        self._last_hover_pos = mouse_pos
+        self._last_hovered = hovered
+            
+    def _index_menu_buttons(self):
+        """Collect each menu's button rects, in button order, for hit-testing"""
+        self._menu_rects: Dict[MenuId, List[pygame.Rect]] = {
+            menu: [button.rect for button in buttons]
+            for menu, buttons in self._menu_buttons.items()
+        }
+        
+    def _hit_test(self, mouse_pos) -> Optional[Button]:
+        """
+        Find the current menu's button under the mouse
         
+        Args:
+            mouse_pos: Mouse position in screen coordinates
+            
+        Returns:
+            The button containing the point, or None
+        """
+        # Buttons never overlap, so the first rect hit by the pointer's pixel is the one
+        index = pygame.Rect(mouse_pos, (1, 1)).collidelist(self._menu_rects[self.current_menu])
+        if index < 0:
+            return None
+        return self._menu_buttons[self.current_menu][index]
+                    
     def update(self, delta_time: float):
         """Update menu animations and state"""
         # Update click cooldown
@@ -225,81 +333,81 @@ class MenuManager:
             
     def render(self, surface: pygame.Surface):
         """Render current menu"""
-        self._render_background(surface)
-        
-        if self.current_menu == "main":
-            self._render_main_menu(surface)
-        elif self.current_menu == "game_select":
-            self._render_game_select_menu(surface)
-        elif self.current_menu == "settings":
-            self._render_settings_menu(surface)
+        size = surface.get_size()
+        buttons = self._menu_buttons[self.current_menu]
+        frame_key = (self.current_menu, size, tuple(button.appearance() for button in buttons))
+        
+        # Between hover changes and animations the menu is static; reuse last frame
+        if frame_key != self._frame_key:
+            frame = self._cached_frame
+            if frame is None or frame.get_size() != size:
+                frame = pygame.Surface(size)
+                if pygame.display.get_surface() is not None:
+                    frame = frame.convert()
+                self._cached_frame = frame
+                
+            self._render_background(frame)
+            self._menu_renderers[self.current_menu](frame)
+            
+            # Always render developer credit
+            self._render_developer_credit(frame)
+            self._frame_key = frame_key
             
-        # Always render developer credit
-        self._render_developer_credit(surface)
+        surface.blit(self._cached_frame, (0, 0))
             
     def _render_background(self, surface: pygame.Surface):
         """Render menu background"""
-        surface.fill((25, 25, 40))  # Dark blue background
-        
-        # Add subtle grid pattern
-        for x in range(0, surface.get_width(), 40):
-            pygame.draw.line(surface, (35, 35, 55), (x, 0), (x, surface.get_height()), 1)
-        for y in range(0, surface.get_height(), 40):
-            pygame.draw.line(surface, (35, 35, 55), (0, y), (surface.get_width(), y), 1)
+        size = surface.get_size()
+        if size != self._bg_size:
+            background = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                background = background.convert()
+            background.fill((25, 25, 40))  # Dark blue background
+            
+            # Add subtle grid pattern
+            for x in range(0, size[0], 40):
+                pygame.draw.line(background, (35, 35, 55), (x, 0), (x, size[1]), 1)
+            for y in range(0, size[1], 40):
+                pygame.draw.line(background, (35, 35, 55), (0, y), (size[0], y), 1)
+                
+            self._bg_cache = background
+            self._bg_size = size
+            
+        surface.blit(self._bg_cache, (0, 0))
             
     def _render_main_menu(self, surface: pygame.Surface):
         """Render main menu"""
         # Title
-        title_font = pygame.font.Font(None, 64)
-        title_text = title_font.render("GAME SUITE", True, (255, 255, 255))
-        surface.blit(title_text, (surface.get_width() // 2 - title_text.get_width() // 2, 100))
+        surface.blit(*self._static_text["title_main"])
         
         # Subtitle
-        subtitle_font = pygame.font.Font(None, 24)
-        subtitle_text = subtitle_font.render("Professional Game Collection", True, (200, 200, 200))
-        surface.blit(subtitle_text, (surface.get_width() // 2 - subtitle_text.get_width() // 2, 170))
+        surface.blit(*self._static_text["subtitle_main"])
         
         # Render buttons
-        for button_id in ["start_game", "settings", "quit"]:
-            self.buttons[button_id].render(surface)
+        self._render_buttons(surface, MenuId.MAIN)
             
     def _render_game_select_menu(self, surface: pygame.Surface):
         """Render game selection menu"""
         # Title
-        title_font = pygame.font.Font(None, 48)
-        title_text = title_font.render("Select Game", True, (255, 255, 255))
-        surface.blit(title_text, (surface.get_width() // 2 - title_text.get_width() // 2, 80))
+        surface.blit(*self._static_text["title_game_select"])
         
         # Render game buttons in centered grid
-        for button_id, button in self.buttons.items():
-            if button_id.startswith("game_") or button_id == "back_to_main":
-                button.render(surface)
+        self._render_buttons(surface, MenuId.GAME_SELECT)
                 
     def _render_settings_menu(self, surface: pygame.Surface):
         """Render settings menu"""
-        title_font = pygame.font.Font(None, 48)
-        title_text = title_font.render("Settings", True, (255, 255, 255))
-        surface.blit(title_text, (surface.get_width() // 2 - title_text.get_width() // 2, 80))
+        surface.blit(*self._static_text["title_settings"])
         
         # Placeholder settings text
-        settings_font = pygame.font.Font(None, 32)
-        settings_text = settings_font.render("Settings Menu - Under Development", True, (200, 200, 200))
-        surface.blit(settings_text, (surface.get_width() // 2 - settings_text.get_width() // 2, 200))
+        surface.blit(*self._static_text["settings_placeholder"])
         
         # Back button
-        self.buttons["settings_back"].render(surface)
+        self._render_buttons(surface, MenuId.SETTINGS)
+        
+    def _render_buttons(self, surface: pygame.Surface, menu: MenuId):
+        """Blit a menu's composited buttons in one call"""
+        surface.blits([button.get_blit_pair() for button in self._menu_buttons[menu]], doreturn=False)
         
     def _render_developer_credit(self, surface: pygame.Surface):
         """Render professional developer credit with low opacity"""
-        credit_font = pygame.font.Font(None, 18)
-        credit_text = "Developed by Gustavo Viana"
-        
-        # Create surface with alpha for transparency
-        text_surface = credit_font.render(credit_text, True, (200, 200, 200))
-        text_surface.set_alpha(128)  # 50% opacity
-        
-        # Position at bottom right with margin
-        text_rect = text_surface.get_rect()
-        text_rect.bottomright = (surface.get_width() - 20, surface.get_height() - 20)
-        
-        surface.blit(text_surface, text_rect)
+        surface.blit(*self._static_text["credit"])
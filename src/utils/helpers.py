@@ -0,0 +1,20 @@
+import pygame
+from typing import Dict
+
+# Default-typeface fonts shared by size; Font objects are read-only once built
+_FONTS: Dict[int, pygame.font.Font] = {}
+
+def get_font(size: int) -> pygame.font.Font:
+    """
+    Return the shared default font for a point size
+
+    Args:
+        size: Font size in points
+
+    Returns:
+        The cached font, created on first request
+    """
+    font = _FONTS.get(size)
+    if font is None:
+        font = _FONTS[size] = pygame.font.Font(None, size)
+    return font
@@ -1,19 +1,25 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from typing import Optional
 
+# Handlers are attached to the shared 'GameSuite' logger only once per process
+_configured = False
+
 class GameLogger:
     """
     Professional logging system for Game Suite
     """
     
-    def __init__(self, log_dir: str = "logs", log_level: int = logging.INFO):
+    def __init__(self, log_dir: Optional[str] = None, log_level: int = logging.INFO):
         """
         Initialize game logger
         
         Args:
-            log_dir: Directory to store log files
+            log_dir: Directory to store log files, or None to log to the console only
             log_level: Logging level
         """
         self.log_dir = log_dir
@@ -21,42 +27,64 @@ class GameLogger:
         
     def _setup_logging(self, log_level: int):
         """Setup logging configuration"""
-        if not os.path.exists(self.log_dir):
-            os.makedirs(self.log_dir)
+        global _configured
+        # Our own logger rather than root, so other libraries' logging is unaffected
+        self.logger = logging.getLogger('GameSuite')
+        if _configured:
+            return
             
-        log_filename = datetime.now().strftime("game_suite_%Y%m%d_%H%M%S.log")
-        log_path = os.path.join(self.log_dir, log_filename)
-        
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_path),
-                logging.StreamHandler()
-            ]
-        )
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [logging.StreamHandler()]
         
-        self.logger = logging.getLogger('GameSuite')
+        # Log files are opt-in so a plain run leaves nothing behind on disk
+        if self.log_dir is not None:
+            os.makedirs(self.log_dir, exist_ok=True)
+            log_filename = datetime.now().strftime("game_suite_%Y%m%d_%H%M%S.log")
+            handlers.append(logging.FileHandler(os.path.join(self.log_dir, log_filename)))
+            
+        for handler in handlers:
+            handler.setFormatter(formatter)
         
-    def info(self, message: str):
+        self.logger.setLevel(log_level)
+        self.logger.propagate = False
+        
+        # The game thread only enqueues records; a listener thread does the I/O
+        log_queue = queue.Queue(-1)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(log_queue, *handlers)
+        self._listener.start()
+        atexit.register(self._listener.stop)
+        _configured = True
+        
+    # Messages use %-style args, formatted only if the level is enabled,
+    # e.g. logger.debug("Moved to %s", pos)
+    def info(self, message: str, *args):
         """Log informational message"""
-        self.logger.info(message)
+        self.logger.info(message, *args)
         
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """Log warning message"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
         
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """Log error message"""
-        self.logger.error(message)
+        self.logger.error(message, *args)
         
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """Log debug message"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
         
-    def critical(self, message: str):
+    def critical(self, message: str, *args):
         """Log critical message"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
+
+# Global logger instance, created on first use so importing this module
+# does not open a log file
+_logger: Optional[GameLogger] = None
 
-# Global logger instance
-logger = GameLogger()
+def get_logger() -> GameLogger:
+    """Get the global game logger, creating it if needed"""
+    global _logger
+    if _logger is None:
+        _logger = GameLogger()
+    return _logger